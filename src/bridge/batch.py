@@ -0,0 +1,117 @@
+"""Evaluation of conditions and rules over many hands at once."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+import numpy as np
+
+from bridge.cards import ALL_CARDS, Suit
+from bridge.conditions import Variable
+
+if TYPE_CHECKING:
+    from bridge.cards import Hand
+    from bridge.conditions import Condition
+    from bridge.rules import Rule
+
+POINTS_FEATURE = 0
+"""Column of the points in a features array."""
+
+NUM_FEATURES = 1 + len(Suit)
+
+NUM_SEATS = 4
+
+_DECK_SEATS = np.repeat(
+    np.arange(NUM_SEATS, dtype=np.uint8), len(ALL_CARDS) // NUM_SEATS
+)
+
+_FEATURE_WEIGHTS = np.zeros((len(ALL_CARDS), NUM_FEATURES), dtype=np.float32)
+for _index, _card in enumerate(ALL_CARDS):
+    _FEATURE_WEIGHTS[_index, POINTS_FEATURE] = _card.points()
+    _FEATURE_WEIGHTS[_index, 1 + _card.suit.value] = 1
+
+
+def length_feature(suit: Suit) -> int:
+    """Return column of the suit length in a features array."""
+    return 1 + suit.value
+
+
+def cards_array(hands: Iterable[Hand]) -> np.ndarray:
+    """Return an (N, 52) boolean array of hands, columns follow ALL_CARDS."""
+    rows = [[card.id for card in hand] for hand in hands]
+    result = np.zeros((len(rows), len(ALL_CARDS)), dtype=bool)
+    for row, indices in enumerate(rows):
+        result[row, indices] = True
+    return result
+
+
+def deal(num_deals: int, rng: np.random.Generator) -> np.ndarray:
+    """Deal random full deals into a (num_deals, 52) array.
+
+    Each element is the seat number (0 to 3) holding the card, columns follow
+    ALL_CARDS. Use ``deals == seat`` to get the cards array of one seat.
+    """
+    return rng.permuted(np.tile(_DECK_SEATS, (num_deals, 1)), axis=1)
+
+
+def features(cards: np.ndarray) -> np.ndarray:
+    """Return an (N, 5) array of points and suit lengths of (N, 52) hands.
+
+    Suit lengths are in columns given by ``length_feature``.
+    """
+    # Floating point product is much faster than the integer one in NumPy.
+    return (cards.astype(np.float32) @ _FEATURE_WEIGHTS).astype(np.int16)
+
+
+def evaluate(condition: Condition, features: np.ndarray) -> np.ndarray:
+    """Evaluate the condition for every row of a features array."""
+    if condition.variable == Variable.POINTS:
+        values = features[:, POINTS_FEATURE]
+    elif condition.variable == Variable.CARDS and condition.suit is not None:
+        values = features[:, length_feature(condition.suit)]
+    else:
+        raise NotImplementedError
+
+    result = np.ones(len(features), dtype=bool)
+    if condition.value_max is not None:
+        result &= values <= condition.value_max
+    if condition.value_min is not None:
+        result &= values >= condition.value_min
+    return result
+
+
+def match(rule: Rule, features: np.ndarray) -> np.ndarray:
+    """Match the rule against every row of a features array."""
+    result = np.ones(len(features), dtype=bool)
+    for cond in rule.require:
+        result &= evaluate(cond, features)
+    for cond in rule.exclude:
+        result &= ~evaluate(cond, features)
+    return result
+
+
+def match_matrix(rules: Sequence[Rule], features: np.ndarray) -> np.ndarray:
+    """Return an (N, num_rules) boolean array of rules matching each hand."""
+    result = np.empty((len(features), len(rules)), dtype=bool)
+    for column, rule in enumerate(rules):
+        result[:, column] = match(rule, features)
+    return result
+
+
+def opening_matrix(
+    rules: Sequence[Rule], deals: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the first seat opening the bidding in every deal.
+
+    Seats of the (K, 52) deals array are numbered from the dealer. Return
+    a (K,) array of the opening seat, which is NUM_SEATS when all seats
+    pass, and a (K, num_rules) boolean array of rules matching its hand.
+    """
+    matrices = np.stack(
+        [match_matrix(rules, features(deals == seat)) for seat in range(NUM_SEATS)]
+    )
+    opens = matrices.any(axis=2)
+    seats = np.where(opens.any(axis=0), opens.argmax(axis=0), NUM_SEATS)
+    matrix = matrices[seats % NUM_SEATS, np.arange(len(deals))]
+    matrix[seats == NUM_SEATS] = False
+    return seats, matrix
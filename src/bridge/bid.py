@@ -27,8 +27,13 @@ class Trump(Enum):
 class Bid:
     """Contract Bid in a bridge game."""
 
+    __slots__ = ('count', 'trump')
+
     count: int
     trump: Trump
 
+    def __reduce__(self):
+        return Bid, (self.count, self.trump)
+
     def as_text(self) -> str:
         return f"{self.count}{self.trump.as_text()}"
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import re
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError, dataclass
 from enum import Enum
+from typing import Iterable
 
 
 class Suit(Enum):
@@ -76,16 +76,54 @@ class Rank(Enum):
         return cls(cls.__strings().index(text))
 
 
-@dataclass(eq=True, frozen=True)
 class Card:
-    """One bridge playing card."""
+    """One bridge playing card.
+
+    There is a single instance of every card, so creating a Card only looks
+    it up. The ``id`` of a card is its index in ALL_CARDS.
+    """
+
+    __slots__ = ('suit', 'rank', 'id', '_points')
 
     suit: Suit
     rank: Rank
+    id: int
+
+    def __new__(cls, suit: Suit, rank: Rank) -> Card:
+        return ALL_CARDS[rank.value * len(Suit) + suit.value]
+
+    @classmethod
+    def _create(cls, suit: Suit, rank: Rank) -> Card:
+        card = object.__new__(cls)
+        object.__setattr__(card, 'suit', suit)
+        object.__setattr__(card, 'rank', rank)
+        object.__setattr__(card, 'id', rank.value * len(Suit) + suit.value)
+        object.__setattr__(card, '_points', _RANK_POINTS[rank.value])
+        return card
+
+    def __setattr__(self, name, value):
+        msg = f"cannot assign to field {name!r}"
+        raise FrozenInstanceError(msg)
+
+    def __delattr__(self, name):
+        msg = f"cannot delete field {name!r}"
+        raise FrozenInstanceError(msg)
+
+    def __reduce__(self):
+        return Card, (self.suit, self.rank)
+
+    # equal cards are the same object, so the default equality applies
+    def __hash__(self):
+        return self.id
 
     def __repr__(self):
         return f'Card({self.suit}, {self.rank})'
 
+    @classmethod
+    def from_id(cls, card_id: int) -> Card:
+        """Return the Card with a given index in ALL_CARDS."""
+        return ALL_CARDS[card_id]
+
     @classmethod
     def from_text(cls, text: str):
         """Create a card from text representation."""
@@ -97,25 +135,158 @@ class Card:
 
     def points(self) -> int:
         """Calculate point value of the Card."""
-        points = {
-            Rank.ACE: 4,
-            Rank.KING: 3,
-            Rank.QUEEN: 2,
-            Rank.JACK: 1,
-        }
-        return points.get(self.rank, 0)
+        return self._points
+
+
+_RANK_POINTS = (0,) * Rank.JACK.value + (1, 2, 3, 4)
+
+ALL_CARDS = tuple(Card._create(suit, rank) for rank in Rank for suit in Suit)
+
+
+SUIT_SIZE = len(Rank)
+
+_HONOR_POINTS = tuple(
+    sum(points for bit, points in enumerate((1, 2, 3, 4)) if honors >> bit & 1)
+    for honors in range(1 << 4)
+)
+
+
+def _card_bit(card: Card) -> int:
+    return 1 << (card.suit.value * SUIT_SIZE + card.rank.value)
+
+
+def holding_points(holding: int) -> int:
+    """Calculate point value of a 13-bit holding of one suit."""
+    return _HONOR_POINTS[holding >> Rank.JACK.value]
+
+
+def holding_length(holding: int) -> int:
+    """Count cards in a 13-bit holding of one suit."""
+    return bin(holding).count('1')
+
+
+def _losers(holding: int) -> int:
+    top = min(holding_length(holding), 3)
+    return top - holding_length(holding >> (SUIT_SIZE - top))
+
+
+def _controls(holding: int) -> int:
+    return 2 * (holding >> Rank.ACE.value & 1) + (holding >> Rank.KING.value & 1)
+
+
+def _quick_tricks(holding: int) -> float:
+    honors = holding >> Rank.QUEEN.value
+    if honors & 0b110 == 0b110:  # AK
+        return 2.0
+    if honors & 0b101 == 0b101:  # AQ
+        return 1.5
+    if honors & 0b011 == 0b011 or honors & 0b100:  # KQ or A
+        return 1.0
+    if honors & 0b010 and holding_length(holding) >= 2:  # Kx
+        return 0.5
+    return 0.0
+
+
+def _quality(holding: int) -> int:
+    return holding_length(holding) + holding_length(holding >> Rank.TEN.value)
+
+
+_HOLDINGS = range(1 << SUIT_SIZE)
+_LOSERS = tuple(map(_losers, _HOLDINGS))
+_CONTROLS = tuple(map(_controls, _HOLDINGS))
+_QUICK_TRICKS = tuple(map(_quick_tricks, _HOLDINGS))
+_QUALITY = tuple(map(_quality, _HOLDINGS))
+
+
+def holding_losers(holding: int) -> int:
+    """Count losing tricks of a 13-bit holding, missing A, K, Q of top cards."""
+    return _LOSERS[holding]
+
+
+def holding_controls(holding: int) -> int:
+    """Count controls of a 13-bit holding, 2 for the ace and 1 for the king."""
+    return _CONTROLS[holding]
+
+
+def holding_quick_tricks(holding: int) -> float:
+    """Count quick tricks of a 13-bit holding: AK 2, AQ 1.5, A or KQ 1, Kx 0.5."""
+    return _QUICK_TRICKS[holding]
+
+
+def holding_quality(holding: int) -> int:
+    """Return suit quality of a 13-bit holding, length plus honors from 10 up."""
+    return _QUALITY[holding]
+
+
+@dataclass(frozen=True)
+class HandProfile:
+    """Features of a Hand used for evaluating conditions.
+
+    Metrics other than points and lengths need the 13-bit holdings, indexed
+    by Suit value, and throw NotImplementedError for profiles without them.
+    """
+
+    points: int
+    lengths: tuple[int, int, int, int]
+    holdings: tuple[int, int, int, int] | None = None
+
+    def length(self, suit: Suit) -> int:
+        """Return number of cards in a given Suit."""
+        return self.lengths[suit.value]
+
+    def _total(self, table: tuple) -> int | float:
+        if self.holdings is None:
+            raise NotImplementedError
+        c, d, h, s = self.holdings
+        return table[c] + table[d] + table[h] + table[s]
+
+    @property
+    def losers(self) -> int:
+        """Return losing trick count of the hand."""
+        return self._total(_LOSERS)
+
+    @property
+    def controls(self) -> int:
+        """Return number of controls of the hand."""
+        return self._total(_CONTROLS)
+
+    @property
+    def quick_tricks(self) -> float:
+        """Return number of quick tricks of the hand."""
+        return self._total(_QUICK_TRICKS)
+
+    @property
+    def qualities(self) -> tuple[int, int, int, int]:
+        """Return suit quality of every suit, indexed by Suit value."""
+        if self.holdings is None:
+            raise NotImplementedError
+        return tuple(_QUALITY[holding] for holding in self.holdings)
+
+    @classmethod
+    def from_holdings(
+        cls: type[HandProfile], holdings: Iterable[int]
+    ) -> HandProfile:
+        """Create a HandProfile from 13-bit holdings indexed by Suit value."""
+        holdings = tuple(holdings)
+        return cls(
+            points=sum(map(holding_points, holdings)),
+            lengths=tuple(map(holding_length, holdings)),
+            holdings=holdings,
+        )
 
 
 class Hand:
     """Hand of bridge cards."""
 
     _cards: set[Card]
+    _profile: HandProfile | None
 
     def __repr__(self) -> str:
         return f'Hand.from_text({self.as_text()!r})'
 
     def __init__(self, cards=None):
         self._cards = set(cards) if cards is not None else set()
+        self._profile = None
 
     def __len__(self):
         return len(self._cards)
@@ -129,10 +300,20 @@ class Hand:
             msg = f'{card!r} already in hand'
             raise ValueError(msg)
         self._cards.add(card)
+        self._profile = None
 
     def points(self) -> int:
         """Calculate point value of the cards in Hand."""
-        return sum(card.points() for card in self._cards)
+        return self.profile().points
+
+    def profile(self) -> HandProfile:
+        """Return features of the Hand, computed once until a Card is added."""
+        if self._profile is None:
+            holdings = [0] * len(Suit)
+            for card in self._cards:
+                holdings[card.suit.value] |= 1 << card.rank.value
+            self._profile = HandProfile.from_holdings(holdings)
+        return self._profile
 
     def as_text(self) -> str:
         """Return text representation of the Hand."""
@@ -149,25 +330,142 @@ class Hand:
     @classmethod
     def from_text(cls: type[Hand], text: str) -> Hand:
         """Create a bridge Hand from text representation."""
-        suits = [Suit.SPADE, Suit.HEART, Suit.DIAMOND, Suit.CLUB]
-        rank_re = re.compile(r"[AKQJ98765432]|10")
-        rank_texts = [rank_re.findall(cards) for cards in text.split('.')]
+        return cls(cards_from_text(text))
+
+
+_TEXT_SUITS = (Suit.SPADE, Suit.HEART, Suit.DIAMOND, Suit.CLUB)
+_TEXT_RANKS = {rank.as_text().replace("10", "T"): rank.value for rank in Rank}
+
+
+def cards_from_text(text: str) -> list[Card]:
+    """Return cards of a Hand given in text representation.
+
+    Throws the same errors as ``Hand.from_text``.
+    """
+    suit_texts = text.split('.')
+    if len(suit_texts) != len(_TEXT_SUITS):
+        msg = f"expecting exactly {len(_TEXT_SUITS)} suits"
+        raise ValueError(msg)
+    if "T" in text:
+        msg = "unknown card rank"
+        raise ValueError(msg)
+
+    cards = []
+    for suit, suit_text in zip(_TEXT_SUITS, suit_texts):
+        suit_cards = _SUIT_CARDS[suit.value]
+        try:
+            cards += [
+                suit_cards[_TEXT_RANKS[c]] for c in suit_text.replace("10", "T")
+            ]
+        except KeyError:
+            msg = "unknown card rank"
+            raise ValueError(msg) from None
 
-        if len(rank_texts) != len(suits):
-            msg = f"expecting exactly {len(suits)} suits"
-            raise ValueError(msg)
+    if len(set(cards)) != len(cards):
+        seen = set()
+        for card in cards:
+            if card in seen:
+                msg = f'{card!r} already in hand'
+                raise ValueError(msg)
+            seen.add(card)
+    return cards
 
-        rebuilt = ".".join("".join(list(rank_text)) for rank_text in rank_texts)
-        if rebuilt != text:
-            msg = "unknown card rank"
-            raise ValueError(msg)
 
+_BIT_CARDS = tuple(Card(suit, rank) for suit in Suit for rank in Rank)
+_SUIT_CARDS = tuple(
+    _BIT_CARDS[suit.value * SUIT_SIZE : (suit.value + 1) * SUIT_SIZE]
+    for suit in Suit
+)
+
+
+class CompactHand:
+    """Hand of bridge cards stored as a 52-bit integer.
+
+    Bit ``suit * 13 + rank`` is set for every card in the hand, so a single
+    suit forms a contiguous 13-bit holding.
+    """
+
+    _mask: int
+    _profile: HandProfile | None
+
+    def __repr__(self) -> str:
+        return f'CompactHand.from_text({self.as_text()!r})'
+
+    def __init__(self, cards=None):
+        self._mask = 0
+        self._profile = None
+        if cards is not None:
+            for card in cards:
+                self._mask |= _card_bit(card)
+
+    def __len__(self):
+        return holding_length(self._mask)
+
+    def __iter__(self):
+        mask = self._mask
+        return (card for bit, card in enumerate(_BIT_CARDS) if mask >> bit & 1)
+
+    def __contains__(self, card: Card) -> bool:
+        return bool(self._mask & _card_bit(card))
+
+    @property
+    def mask(self) -> int:
+        """Return the 52-bit integer representation of the Hand."""
+        return self._mask
+
+    @classmethod
+    def from_mask(cls: type[CompactHand], mask: int) -> CompactHand:
+        """Create a CompactHand from the 52-bit integer representation."""
+        if mask >> (SUIT_SIZE * len(Suit)):
+            msg = "mask has bits outside of the deck"
+            raise ValueError(msg)
         hand = cls()
-        for suit, ranks in zip(suits, rank_texts):
-            for rank in ranks:
-                card = Card(suit, Rank.from_text(rank))
-                hand.add(card)
+        hand._mask = mask
         return hand
 
+    def add(self, card: Card) -> None:
+        """Add a Card to Hand. Throws if Card is already in Hand."""
+        bit = _card_bit(card)
+        if self._mask & bit:
+            msg = f'{card!r} already in hand'
+            raise ValueError(msg)
+        self._mask |= bit
+        self._profile = None
+
+    def holding(self, suit: Suit) -> int:
+        """Return the 13-bit holding of a given Suit, bit number is Rank value."""
+        return self._mask >> (suit.value * SUIT_SIZE) & ((1 << SUIT_SIZE) - 1)
+
+    def points(self) -> int:
+        """Calculate point value of the cards in Hand."""
+        return self.profile().points
+
+    def profile(self) -> HandProfile:
+        """Return features of the Hand, computed once until a Card is added."""
+        if self._profile is None:
+            self._profile = HandProfile.from_holdings(map(self.holding, Suit))
+        return self._profile
+
+    def as_text(self) -> str:
+        """Return text representation of the Hand."""
+
+        def stringize(holding):
+            ranks = (rank for rank in reversed(Rank) if holding >> rank.value & 1)
+            return "".join(map(Rank.as_text, ranks))
+
+        suits = sorted(Suit, reverse=True)
+        return ".".join(stringize(self.holding(suit)) for suit in suits)
+
+    @classmethod
+    def from_text(cls: type[CompactHand], text: str) -> CompactHand:
+        """Create a CompactHand from text representation."""
+        return cls(cards_from_text(text))
+
+    @classmethod
+    def from_hand(cls: type[CompactHand], hand: Hand) -> CompactHand:
+        """Create a CompactHand holding the same cards as a given Hand."""
+        return cls(hand)
 
-ALL_CARDS = tuple(Card(suit, rank) for rank in Rank for suit in Suit)
+    def to_hand(self) -> Hand:
+        """Return a Hand holding the same cards."""
+        return Hand(self)
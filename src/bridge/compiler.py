@@ -0,0 +1,76 @@
+"""Compilation of bidding rules into a single matching function."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Sequence
+
+from bridge.conditions import Variable
+
+if TYPE_CHECKING:
+    from bridge.cards import Hand
+    from bridge.conditions import Condition
+    from bridge.rules import Rule
+
+
+def _value_expression(condition: Condition) -> str:
+    if condition.variable == Variable.POINTS:
+        return "points"
+    if condition.variable == Variable.CARDS and condition.suit is not None:
+        return f"lengths[{condition.suit.value}]"
+    if condition.variable == Variable.LOSERS:
+        return "profile.losers"
+    if condition.variable == Variable.CONTROLS:
+        return "profile.controls"
+    if condition.variable == Variable.QUICK_TRICKS:
+        return "profile.quick_tricks"
+    if condition.variable == Variable.SUIT_QUALITY and condition.suit is not None:
+        return f"profile.qualities[{condition.suit.value}]"
+    raise NotImplementedError
+
+
+def _condition_expression(condition: Condition) -> str:
+    value = _value_expression(condition)
+    if condition.value_min is not None and condition.value_max is not None:
+        return f"{condition.value_min!r} <= {value} <= {condition.value_max!r}"
+    if condition.value_min is not None:
+        return f"{value} >= {condition.value_min!r}"
+    if condition.value_max is not None:
+        return f"{value} <= {condition.value_max!r}"
+    return "True"
+
+
+def _rule_expression(rule: Rule) -> str:
+    terms = [_condition_expression(cond) for cond in rule.require]
+    terms += [f"not ({_condition_expression(cond)})" for cond in rule.exclude]
+    return " and ".join(terms) or "True"
+
+
+def rules_source(rules: Sequence[Rule]) -> str:
+    """Return source code of a function matching a hand against the rules.
+
+    The generated function expects the rules to be available as ``rules``.
+    """
+    lines = [
+        "def match(hand):",
+        "    profile = hand.profile()",
+        "    points = profile.points",
+        "    lengths = profile.lengths",
+        "    matches = []",
+    ]
+    for index, rule in enumerate(rules):
+        lines.append(f"    if {_rule_expression(rule)}:")
+        lines.append(f"        matches.append(rules[{index}])")
+    lines.append("    return matches")
+    return "\n".join(lines) + "\n"
+
+
+def compile_rules(rules: Sequence[Rule]) -> Callable[[Hand], list[Rule]]:
+    """Compile the rules into one function returning every matching rule.
+
+    The result is the same as filtering the rules with ``Rule.match``, in the
+    order of the rules.
+    """
+    namespace = {"rules": tuple(rules)}
+    code = compile(rules_source(rules), "<compiled rules>", "exec")
+    exec(code, namespace)  # noqa: S102
+    return namespace["match"]
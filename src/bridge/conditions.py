@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
 
-from bridge.cards import Hand, Suit
+from bridge.cards import Suit
+
+if TYPE_CHECKING:
+    from bridge.cards import Hand, HandProfile
 
 
 def points(count: int) -> Condition:
@@ -42,12 +47,41 @@ def cards_range(count_min: int, count_max: int, suit: Suit) -> Condition:
     )
 
 
+def losers_max(count: int) -> Condition:
+    return Condition(Variable.LOSERS, value_max=count)
+
+
+def losers_range(count_min: int, count_max: int) -> Condition:
+    return Condition(Variable.LOSERS, value_min=count_min, value_max=count_max)
+
+
+def controls_min(count: int) -> Condition:
+    return Condition(Variable.CONTROLS, value_min=count)
+
+
+def controls_range(count_min: int, count_max: int) -> Condition:
+    return Condition(Variable.CONTROLS, value_min=count_min, value_max=count_max)
+
+
+def quick_tricks_min(count: float) -> Condition:
+    return Condition(Variable.QUICK_TRICKS, value_min=count)
+
+
+def suit_quality_min(count: int, suit: Suit) -> Condition:
+    return Condition(Variable.SUIT_QUALITY, value_min=count, suit=suit)
+
+
 class Variable(Enum):
     POINTS = 1
     CARDS = 2
+    LOSERS = 3
+    CONTROLS = 4
+    QUICK_TRICKS = 5
+    SUIT_QUALITY = 6
 
 
-@dataclass
+# slotted dataclasses with default values need Python 3.10
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class Condition:
     variable: Variable
     value_min: int | None = None
@@ -55,13 +89,26 @@ class Condition:
     suit: Suit | None = None
 
     def evaluate(self, hand: Hand) -> bool:
+        return self.accepts(self.value(hand.profile()))
+
+    def value(self, profile: HandProfile) -> int:
+        """Return the value of the condition variable in a given hand profile."""
         if self.variable == Variable.POINTS:
-            value = hand.points()
-        elif self.variable == Variable.CARDS:
-            value = sum(card.suit == self.suit for card in hand)
-        else:
-            raise NotImplementedError
+            return profile.points
+        if self.variable == Variable.CARDS and self.suit is not None:
+            return profile.lengths[self.suit.value]
+        if self.variable == Variable.LOSERS:
+            return profile.losers
+        if self.variable == Variable.CONTROLS:
+            return profile.controls
+        if self.variable == Variable.QUICK_TRICKS:
+            return profile.quick_tricks
+        if self.variable == Variable.SUIT_QUALITY and self.suit is not None:
+            return profile.qualities[self.suit.value]
+        raise NotImplementedError
 
+    def accepts(self, value: int) -> bool:
+        """Check whether a value of the condition variable is within limits."""
         cond = True
         if self.value_max is not None:
             cond = cond and value <= self.value_max
@@ -80,19 +127,37 @@ class Condition:
                 return f"od {self.value_min} PC"
             if self.value_max is not None:
                 return f"do {self.value_max} PC"
-        elif self.variable == Variable.CARDS and self.suit is not None:
+        elif self.variable in _UNIT_NAMES:
+            return self._describe_range(_UNIT_NAMES[self.variable])
+        elif (
+            self.variable in (Variable.CARDS, Variable.SUIT_QUALITY)
+            and self.suit is not None
+        ):
             suit_name = {
                 Suit.CLUB: "trefli",
                 Suit.DIAMOND: "kar",
                 Suit.SPADE: "pików",
                 Suit.HEART: "kierów",
             }[self.suit]
-            if self.value_max is not None and self.value_min is not None:
-                if self.value_min == self.value_max:
-                    return f"{self.value_max} {suit_name}"
-                return f"od {self.value_min} do {self.value_max} {suit_name}"
-            if self.value_min is not None:
-                return f"od {self.value_min} {suit_name}"
-            if self.value_max is not None:
-                return f"do {self.value_max} {suit_name}"
+            if self.variable == Variable.SUIT_QUALITY:
+                return self._describe_range(f"jakości {suit_name}")
+            return self._describe_range(suit_name)
         raise NotImplementedError
+
+    def _describe_range(self, unit: str) -> str:
+        if self.value_max is not None and self.value_min is not None:
+            if self.value_min == self.value_max:
+                return f"{self.value_max} {unit}"
+            return f"od {self.value_min} do {self.value_max} {unit}"
+        if self.value_min is not None:
+            return f"od {self.value_min} {unit}"
+        if self.value_max is not None:
+            return f"do {self.value_max} {unit}"
+        raise NotImplementedError
+
+
+_UNIT_NAMES = {
+    Variable.LOSERS: "przegrywających",
+    Variable.CONTROLS: "kontroli",
+    Variable.QUICK_TRICKS: "szybkich lew",
+}
@@ -0,0 +1,107 @@
+"""Exhaustive analysis of gaps and overlaps between bidding rules."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from math import comb
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
+from bridge.batch import NUM_FEATURES, POINTS_FEATURE, length_feature, match_matrix
+from bridge.cards import ALL_CARDS, SUIT_SIZE, Suit
+from bridge.distribution import hand_counts
+from bridge.lookup import depends_on_shape_only
+
+if TYPE_CHECKING:
+    from bridge.lookup import Shape
+    from bridge.rules import Rule
+
+TOTAL_HANDS = comb(len(ALL_CARDS), SUIT_SIZE)
+"""Number of distinct bridge hands."""
+
+
+def shape_text(shape: Shape) -> str:
+    """Return suit lengths of a shape from spades to clubs, like ``5-4-3-1``."""
+    return "-".join(str(shape[suit.value]) for suit in reversed(Suit))
+
+
+@dataclass(frozen=True)
+class Region:
+    """Hands of one shape within a range of points, matching the same rules.
+
+    Rules are given by their indices in the analyzed sequence.
+    """
+
+    rules: tuple[int, ...]
+    shape: Shape
+    min_points: int
+    max_points: int
+    count: int
+
+    @property
+    def probability(self) -> float:
+        """Return probability of a random hand falling into the region."""
+        return self.count / TOTAL_HANDS
+
+
+@lru_cache(maxsize=None)
+def _cells(min_points: int) -> tuple[np.ndarray, np.ndarray]:
+    rows = list(hand_counts(min_points))
+    cells = np.zeros((len(rows), NUM_FEATURES), dtype=np.int16)
+    counts = np.array([count for _, _, count in rows], dtype=np.int64)
+    for row, (points, shape, _) in enumerate(rows):
+        cells[row, POINTS_FEATURE] = points
+        for suit in Suit:
+            cells[row, length_feature(suit)] = shape[suit.value]
+    return cells, counts
+
+
+def hands_total(min_points: int = 0) -> int:
+    """Return the number of distinct hands with at least ``min_points``."""
+    return int(_cells(min_points)[1].sum())
+
+
+def regions(
+    rules: Sequence[Rule], min_points: int = 0, problems_only: bool = True
+) -> list[Region]:
+    """Split hands with at least ``min_points`` into regions by matching rules.
+
+    Every combination of points and suit lengths is evaluated at once, so the
+    counts are exact and the rules must depend only on points and shape.
+    Points of one shape matching the same rules are merged into one region.
+    With ``problems_only``, regions matching exactly one rule are left out.
+    Regions are sorted from the most probable.
+    """
+    if not all(depends_on_shape_only(rule.require + rule.exclude) for rule in rules):
+        msg = "rules depend on more than points and suit lengths"
+        raise ValueError(msg)
+    cells, counts = _cells(min_points)
+    matrix = match_matrix(rules, cells)
+    if problems_only:
+        problems = matrix.sum(axis=1) != 1
+        cells, counts, matrix = cells[problems], counts[problems], matrix[problems]
+
+    result = []
+    current = None
+    for cell, count, matches in zip(cells.tolist(), counts.tolist(), matrix):
+        points = cell[POINTS_FEATURE]
+        shape = tuple(cell[length_feature(suit)] for suit in Suit)
+        indices = tuple(np.flatnonzero(matches).tolist())
+        if (
+            current is not None
+            and current.rules == indices
+            and current.shape == shape
+            and current.max_points + 1 == points
+        ):
+            current = Region(
+                indices, shape, current.min_points, points, current.count + count
+            )
+        else:
+            if current is not None:
+                result.append(current)
+            current = Region(indices, shape, points, points, count)
+    if current is not None:
+        result.append(current)
+    return sorted(result, key=lambda region: region.count, reverse=True)
@@ -0,0 +1,133 @@
+"""Full deals of four hands in a bridge card game."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Iterator, Sequence
+
+from bridge.cards import ALL_CARDS, Hand
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class Seat(Enum):
+    """Seat at a bridge table, in clockwise order."""
+
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}.{self._name_}'
+
+    @classmethod
+    def __strings(cls):
+        return ('N', 'E', 'S', 'W')
+
+    def as_text(self) -> str:
+        """Return text representation of the Seat."""
+        return Seat.__strings()[self.value]
+
+    @classmethod
+    def from_text(cls, text: str) -> Seat:
+        """Create a Seat from the text representation."""
+        return cls(cls.__strings().index(text))
+
+    def next(self, offset: int = 1) -> Seat:
+        """Return the Seat following clockwise after ``offset`` seats."""
+        return Seat((self.value + offset) % len(Seat))
+
+    @property
+    def partner(self) -> Seat:
+        return self.next(2)
+
+
+class Vulnerability(Enum):
+    """Vulnerable sides of a deal."""
+
+    NONE = 0
+    NORTH_SOUTH = 1
+    EAST_WEST = 2
+    BOTH = 3
+
+    @classmethod
+    def __strings(cls):
+        return ('None', 'NS', 'EW', 'All')
+
+    def as_text(self) -> str:
+        """Return text representation of the Vulnerability, as used by PBN."""
+        return Vulnerability.__strings()[self.value]
+
+    @classmethod
+    def from_text(cls, text: str) -> Vulnerability:
+        """Create a Vulnerability from the text representation."""
+        aliases = {'Love': 'None', '-': 'None', 'Both': 'All'}
+        return cls(cls.__strings().index(aliases.get(text, text)))
+
+    def is_vulnerable(self, seat: Seat) -> bool:
+        """Check whether the side of a given Seat is vulnerable."""
+        if self == Vulnerability.BOTH:
+            return True
+        if self == Vulnerability.NORTH_SOUTH:
+            return seat in (Seat.NORTH, Seat.SOUTH)
+        if self == Vulnerability.EAST_WEST:
+            return seat in (Seat.EAST, Seat.WEST)
+        return False
+
+
+_BOARD_VULNERABILITY = (0, 1, 2, 3, 1, 2, 3, 0, 2, 3, 0, 1, 3, 0, 1, 2)
+
+
+def board_dealer(board: int) -> Seat:
+    """Return the dealer of a duplicate board with a given number."""
+    return Seat((board - 1) % len(Seat))
+
+
+def board_vulnerability(board: int) -> Vulnerability:
+    """Return the vulnerability of a duplicate board with a given number."""
+    return Vulnerability(_BOARD_VULNERABILITY[(board - 1) % 16])
+
+
+@dataclass
+class Deal:
+    """Four hands dealt to the seats, with the dealer and vulnerability."""
+
+    hands: tuple[Hand, Hand, Hand, Hand]
+    dealer: Seat = Seat.NORTH
+    vulnerability: Vulnerability = Vulnerability.NONE
+
+    def __post_init__(self):
+        if len(self.hands) != len(Seat):
+            msg = f"expecting exactly {len(Seat)} hands"
+            raise ValueError(msg)
+        self.hands = tuple(self.hands)
+
+    def hand(self, seat: Seat) -> Hand:
+        """Return the Hand of a given Seat."""
+        return self.hands[seat.value]
+
+    def seats_from_dealer(self) -> list[Seat]:
+        """Return seats in the order of bidding, starting from the dealer."""
+        return [self.dealer.next(offset) for offset in range(len(Seat))]
+
+    def hands_from_dealer(self) -> Iterator[tuple[Seat, Hand]]:
+        """Iterate over seats and their hands, starting from the dealer."""
+        for seat in self.seats_from_dealer():
+            yield seat, self.hand(seat)
+
+    @classmethod
+    def from_seats(
+        cls: type[Deal],
+        seats: Sequence[int] | np.ndarray,
+        dealer: Seat = Seat.NORTH,
+        vulnerability: Vulnerability = Vulnerability.NONE,
+    ) -> Deal:
+        """Create a Deal from seat numbers of ALL_CARDS, as made by batch.deal."""
+        cards = [[] for _ in Seat]
+        for card, seat in zip(ALL_CARDS, seats):
+            cards[seat].append(card)
+        hands = tuple(Hand(seat_cards) for seat_cards in cards)
+        return cls(hands, dealer, vulnerability)
@@ -0,0 +1,95 @@
+"""Dealing random bridge hands and deals."""
+
+from __future__ import annotations
+
+import random
+from functools import lru_cache
+from itertools import product
+from math import comb
+from typing import TYPE_CHECKING
+
+from bridge.cards import ALL_CARDS, SUIT_SIZE, Card, Hand, Rank, Suit
+from bridge.deal import Deal, board_dealer, board_vulnerability
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+HONORS = (Rank.JACK, Rank.QUEEN, Rank.KING, Rank.ACE)
+
+_SPOT_CARDS = tuple(card for card in ALL_CARDS if card.rank not in HONORS)
+
+
+@lru_cache(maxsize=None)
+def _honor_counts(min_points: int) -> tuple[list[tuple[int, ...]], list[int]]:
+    """Return numbers of honors of each rank and how many hands hold them.
+
+    Only honors giving at least ``min_points`` are included.
+    """
+    counts = []
+    weights = []
+    for numbers in product(range(len(Suit) + 1), repeat=len(HONORS)):
+        num_honors = sum(numbers)
+        points = sum(
+            n * Card(Suit.CLUB, r).points() for n, r in zip(numbers, HONORS)
+        )
+        if points < min_points or num_honors > SUIT_SIZE:
+            continue
+        weight = comb(len(_SPOT_CARDS), SUIT_SIZE - num_honors)
+        for number in numbers:
+            weight *= comb(len(Suit), number)
+        counts.append(numbers)
+        weights.append(weight)
+    if not counts:
+        msg = f"no hand has at least {min_points} points"
+        raise ValueError(msg)
+    return counts, weights
+
+
+def deal_hand(min_points: int = 0, rng=random) -> Hand:
+    """Deal a random hand with at least ``min_points`` points.
+
+    Every such hand is equally likely, as if hands with fewer points were
+    dealt and rejected. Honors are chosen first, weighted by the number of
+    hands holding them, then the hand is filled with spot cards.
+    ``rng`` is a ``random.Random`` instance or the ``random`` module.
+    """
+    counts, weights = _honor_counts(min_points)
+    (numbers,) = rng.choices(counts, weights)
+    cards = rng.sample(_SPOT_CARDS, SUIT_SIZE - sum(numbers))
+    for rank, number in zip(HONORS, numbers):
+        cards += [Card(suit, rank) for suit in rng.sample(list(Suit), number)]
+    return Hand(cards)
+
+
+def deal_hands(num_hands: int, min_points: int = 0, rng=random) -> Iterator[Hand]:
+    """Deal random hands with at least ``min_points`` points.
+
+    Without a minimum, all four hands of every dealt deal are used.
+    """
+    if min_points > 0:
+        for _ in range(num_hands):
+            yield deal_hand(min_points, rng)
+        return
+    while num_hands > 0:
+        hands = deal_full(rng).hands[:num_hands]
+        yield from hands
+        num_hands -= len(hands)
+
+
+def deal_full(rng=random, board: int = 1) -> Deal:
+    """Deal a random Deal of a duplicate board with a given number.
+
+    All four hands come from a single shuffle of the deck.
+    """
+    deck = list(ALL_CARDS)
+    rng.shuffle(deck)
+    hands = tuple(
+        Hand(deck[i : i + SUIT_SIZE]) for i in range(0, len(deck), SUIT_SIZE)
+    )
+    return Deal(hands, board_dealer(board), board_vulnerability(board))
+
+
+def deal_deals(num_deals: int, rng=random) -> Iterator[Deal]:
+    """Deal random deals of consecutive duplicate boards, starting at 1."""
+    for board in range(1, num_deals + 1):
+        yield deal_full(rng, board)
@@ -0,0 +1,67 @@
+"""Exact distribution of points and suit lengths in bridge hands."""
+
+from __future__ import annotations
+
+from collections import Counter
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator
+
+from bridge.cards import SUIT_SIZE, holding_length, holding_points
+from bridge.lookup import all_shapes
+
+if TYPE_CHECKING:
+    from bridge.lookup import RuleTable, Shape
+
+
+@lru_cache(maxsize=None)
+def holding_counts() -> tuple[tuple[int, ...], ...]:
+    """Count holdings of one suit by length and points.
+
+    Element ``[length][points]`` is the number of distinct holdings.
+    """
+    counts = [[0] * 11 for _ in range(SUIT_SIZE + 1)]
+    for holding in range(1 << SUIT_SIZE):
+        counts[holding_length(holding)][holding_points(holding)] += 1
+    return tuple(map(tuple, counts))
+
+
+def shape_points_counts(shape: Shape) -> list[int]:
+    """Count hands of a given shape by points, element index is points."""
+    counts = [1]
+    for length in shape:
+        suit_counts = holding_counts()[length]
+        combined = [0] * (len(counts) + len(suit_counts) - 1)
+        for points, count in enumerate(counts):
+            for suit_points, suit_count in enumerate(suit_counts):
+                combined[points + suit_points] += count * suit_count
+        counts = combined
+    return counts
+
+
+def hand_counts(min_points: int = 0) -> Iterator[tuple[int, Shape, int]]:
+    """Iterate over points, shape and number of hands having them.
+
+    Only combinations with at least ``min_points`` and at least one hand
+    are generated.
+    """
+    for shape in all_shapes():
+        for points, count in enumerate(shape_points_counts(shape)):
+            if count and points >= min_points:
+                yield points, shape, count
+
+
+def match_counts(table: RuleTable, min_points: int = 0) -> Counter[tuple[int, ...]]:
+    """Count hands with at least ``min_points`` by the matching rules.
+
+    Keys are indices of the matching rules in ``table.rules``. The counts are
+    exact, so the rules must depend only on points and shape.
+    """
+    if not table.shape_only:
+        msg = "rules depend on more than points and suit lengths"
+        raise ValueError(msg)
+    indices = {id(rule): index for index, rule in enumerate(table.rules)}
+    counts = Counter()
+    for points, shape, count in hand_counts(min_points):
+        matches = table.lookup(points, shape)
+        counts[tuple(indices[id(rule)] for rule in matches)] += count
+    return counts
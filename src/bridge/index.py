@@ -0,0 +1,53 @@
+"""Index of rules by the points of matching hands."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+from bridge.conditions import Variable
+from bridge.lookup import MAX_POINTS
+
+if TYPE_CHECKING:
+    from bridge.cards import Hand
+    from bridge.rules import Rule
+
+
+def accepts_points(rule: Rule, points: int) -> bool:
+    """Check whether the points conditions of the rule accept the points.
+
+    Other conditions of the rule are not checked.
+    """
+    return all(
+        cond.accepts(points)
+        for cond in rule.require
+        if cond.variable == Variable.POINTS
+    ) and not any(
+        cond.accepts(points)
+        for cond in rule.exclude
+        if cond.variable == Variable.POINTS
+    )
+
+
+class RuleIndex:
+    """Rules bucketed by the points of hands they can match.
+
+    Matching a hand evaluates only the rules whose points conditions accept
+    the points of the hand.
+    """
+
+    rules: tuple[Rule, ...]
+
+    def __init__(self, rules: Sequence[Rule]):
+        self.rules = tuple(rules)
+        self._buckets = tuple(
+            tuple(rule for rule in self.rules if accepts_points(rule, points))
+            for points in range(MAX_POINTS + 1)
+        )
+
+    def candidates(self, points: int) -> tuple[Rule, ...]:
+        """Return rules which can match hands with the points."""
+        return self._buckets[points]
+
+    def match(self, hand: Hand) -> list[Rule]:
+        """Return all rules matching the hand, in the order of the rules."""
+        return [rule for rule in self._buckets[hand.points()] if rule.match(hand)]
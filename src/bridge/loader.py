@@ -0,0 +1,70 @@
+"""Streaming loaders of hands given in text representation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+import numpy as np
+
+from bridge.cards import ALL_CARDS, CompactHand, Hand, cards_from_text
+
+if TYPE_CHECKING:
+    from bridge.cards import Card
+
+
+def _hand_texts(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    for number, line in enumerate(lines, start=1):
+        text = line.strip()
+        if text and not text.startswith('#'):
+            yield number, text
+
+
+def _cards(number: int, text: str) -> list[Card]:
+    try:
+        return cards_from_text(text)
+    except ValueError as error:
+        msg = f"line {number}: {error}"
+        raise ValueError(msg) from error
+
+
+def load_hands(
+    lines: Iterable[str], compact: bool = False
+) -> Iterator[Hand | CompactHand]:
+    """Load hands in text representation, one hand per line.
+
+    Blank lines and lines starting with ``#`` are skipped. Invalid hands
+    throw the errors of ``Hand.from_text``, prefixed with the line number.
+    With ``compact`` set, CompactHand objects are generated.
+    """
+    hand_type = CompactHand if compact else Hand
+    for number, text in _hand_texts(lines):
+        yield hand_type(_cards(number, text))
+
+
+def load_hand_arrays(
+    lines: Iterable[str], batch_size: int = 100_000
+) -> Iterator[np.ndarray]:
+    """Load hands like ``load_hands`` into (N, 52) boolean arrays.
+
+    Arrays have at most ``batch_size`` rows and columns following ALL_CARDS,
+    as used by ``bridge.batch``.
+    """
+    rows = []
+    columns = []
+    num_hands = 0
+    for number, text in _hand_texts(lines):
+        indices = [card.id for card in _cards(number, text)]
+        rows += [num_hands] * len(indices)
+        columns += indices
+        num_hands += 1
+        if num_hands == batch_size:
+            yield _cards_array(num_hands, rows, columns)
+            rows, columns, num_hands = [], [], 0
+    if num_hands:
+        yield _cards_array(num_hands, rows, columns)
+
+
+def _cards_array(num_hands: int, rows: list[int], columns: list[int]) -> np.ndarray:
+    result = np.zeros((num_hands, len(ALL_CARDS)), dtype=bool)
+    result[rows, columns] = True
+    return result
@@ -0,0 +1,100 @@
+"""Lookup tables classifying hands by points and shape."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence
+
+from bridge.cards import SUIT_SIZE, HandProfile
+from bridge.conditions import Variable
+
+if TYPE_CHECKING:
+    from bridge.cards import Hand
+    from bridge.conditions import Condition
+    from bridge.rules import Rule
+
+MAX_POINTS = 37
+
+Shape = tuple[int, int, int, int]
+
+
+def all_shapes() -> Iterator[Shape]:
+    """Iterate over suit lengths of every possible hand, indexed by Suit value."""
+    for clubs in range(SUIT_SIZE + 1):
+        for diamonds in range(SUIT_SIZE + 1 - clubs):
+            for hearts in range(SUIT_SIZE + 1 - clubs - diamonds):
+                yield (
+                    clubs,
+                    diamonds,
+                    hearts,
+                    SUIT_SIZE - clubs - diamonds - hearts,
+                )
+
+
+def depends_on_shape_only(conditions: Iterable[Condition]) -> bool:
+    """Check whether the conditions depend only on the points and suit lengths."""
+    return all(
+        cond.variable == Variable.POINTS
+        or (cond.variable == Variable.CARDS and cond.suit is not None)
+        for cond in conditions
+    )
+
+
+def _match_profile(rule: Rule, profile: HandProfile) -> bool:
+    return all(
+        cond.accepts(cond.value(profile)) for cond in rule.require
+    ) and not any(cond.accepts(cond.value(profile)) for cond in rule.exclude)
+
+
+class RuleTable:
+    """Table of rules matching hands with given points and shape.
+
+    Rules that depend only on the points and suit lengths are evaluated once
+    per table entry. Remaining rules are matched against every hand.
+    """
+
+    rules: tuple[Rule, ...]
+
+    def __init__(self, rules: Sequence[Rule]):
+        self.rules = tuple(rules)
+        self._static = tuple(
+            rule
+            for rule in self.rules
+            if depends_on_shape_only(rule.require + rule.exclude)
+        )
+        self._fallback = tuple(
+            rule for rule in self.rules if not any(rule is s for s in self._static)
+        )
+        self._table: dict[tuple[int, Shape], tuple[Rule, ...]] = {}
+
+    def __len__(self):
+        return len(self._table)
+
+    @property
+    def shape_only(self) -> bool:
+        """Check whether all rules depend only on the points and suit lengths."""
+        return not self._fallback
+
+    def build(self) -> None:
+        """Fill the table for every possible combination of points and shape."""
+        for shape in all_shapes():
+            for points in range(MAX_POINTS + 1):
+                self.lookup(points, shape)
+
+    def lookup(self, points: int, shape: Shape) -> tuple[Rule, ...]:
+        """Return rules depending only on points and shape that match them."""
+        key = (points, shape)
+        matches = self._table.get(key)
+        if matches is None:
+            profile = HandProfile(points=points, lengths=shape)
+            matches = tuple(r for r in self._static if _match_profile(r, profile))
+            self._table[key] = matches
+        return matches
+
+    def match(self, hand: Hand) -> tuple[Rule, ...]:
+        """Return all rules matching the hand, in the order of the rules."""
+        profile = hand.profile()
+        matches = self.lookup(profile.points, profile.lengths)
+        if not self._fallback:
+            return matches
+        matches += tuple(rule for rule in self._fallback if rule.match(hand))
+        return tuple(rule for rule in self.rules if any(rule is m for m in matches))
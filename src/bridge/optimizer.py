@@ -0,0 +1,108 @@
+"""Reordering of conditions so that matching rules fails as early as possible."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from functools import partial
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+from bridge.cards import HandProfile
+from bridge.distribution import hand_counts
+
+if TYPE_CHECKING:
+    from bridge.cards import Hand
+    from bridge.conditions import Condition
+    from bridge.rules import Rule
+
+Samples = Sequence[tuple[HandProfile, int]]
+"""Hand profiles with their weights, such as numbers of hands."""
+
+
+def exact_samples(min_points: int = 0) -> Samples:
+    """Return profiles of all hands with at least ``min_points``, exactly weighted."""
+    return [
+        (HandProfile(points=points, lengths=shape), count)
+        for points, shape, count in hand_counts(min_points)
+    ]
+
+
+def hand_samples(hands: Iterable[Hand]) -> Samples:
+    """Return profiles of the hands, each with weight 1."""
+    return [(hand.profile(), 1) for hand in hands]
+
+
+def _holds(condition: Condition, profile: HandProfile) -> bool | None:
+    try:
+        return condition.accepts(condition.value(profile))
+    except NotImplementedError:
+        return None
+
+
+def _rejected_weight(condition: Condition, samples: Samples, rejecting: bool) -> int:
+    return sum(w for p, w in samples if _holds(condition, p) is rejecting)
+
+
+def order_conditions(
+    conditions: Sequence[Condition], samples: Samples, rejecting: bool
+) -> list[Condition]:
+    """Order conditions so that samples are rejected by the earliest ones.
+
+    A sample is rejected by a condition whose result equals ``rejecting``.
+    The condition rejecting most of the samples not rejected yet goes first.
+    Conditions not evaluable on a profile keep their order at the end.
+    """
+    if not samples:
+        return list(conditions)
+    samples = list(samples)
+    profile = samples[0][0]
+    unknown = [c for c in conditions if _holds(c, profile) is None]
+    remaining = [c for c in conditions if _holds(c, profile) is not None]
+    ordered = []
+    while remaining:
+        weight = partial(_rejected_weight, samples=samples, rejecting=rejecting)
+        best = max(remaining, key=weight)
+        ordered.append(best)
+        remaining = [c for c in remaining if c is not best]
+        samples = [(p, w) for p, w in samples if _holds(best, p) is not rejecting]
+    return ordered + unknown
+
+
+def optimize_rule(rule: Rule, samples: Samples) -> Rule:
+    """Return a copy of the rule with conditions ordered by selectivity.
+
+    The copy matches the same hands, but its description lists the
+    conditions in the new order.
+    """
+    return replace(
+        rule,
+        require=order_conditions(rule.require, samples, rejecting=False),
+        exclude=order_conditions(rule.exclude, samples, rejecting=True),
+    )
+
+
+def optimize_rules(rules: Iterable[Rule], samples: Samples) -> list[Rule]:
+    """Return copies of the rules with conditions ordered by selectivity."""
+    return [optimize_rule(rule, samples) for rule in rules]
+
+
+def order_by_frequency(rules: Iterable[Rule], samples: Samples) -> list[Rule]:
+    """Return rules ordered from the most often matching one.
+
+    Useful when looking for any matching rule rather than all of them.
+    Rules with required or excluded conditions not evaluable on a profile
+    keep their order at the end.
+    """
+    samples = list(samples)
+
+    def matched_weight(rule):
+        conditions = [*rule.require, *rule.exclude]
+        if samples and any(_holds(c, samples[0][0]) is None for c in conditions):
+            return -1
+        return sum(
+            w
+            for p, w in samples
+            if all(_holds(c, p) for c in rule.require)
+            and not any(_holds(c, p) for c in rule.exclude)
+        )
+
+    return sorted(rules, key=matched_weight, reverse=True)
@@ -0,0 +1,187 @@
+"""Reading and writing deals in Portable Bridge Notation (PBN)."""
+
+from __future__ import annotations
+
+import codecs
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Iterator, TextIO
+
+from bridge.cards import Hand
+from bridge.deal import Deal, Seat, Vulnerability
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Mapping
+
+SEATS = "NESW"
+"""Seats in clockwise order, as letters used by PBN."""
+
+_TAG_RE = re.compile(r'^\[(\w+)\s+"((?:[^"\\]|\\.)*)"\]$')
+
+_CHUNK_BYTES = 1 << 20
+
+
+def hand_from_pbn(text: str) -> Hand:
+    """Create a Hand from PBN text representation, which uses T for tens."""
+    return Hand.from_text(text.upper().replace("10", "T").replace("T", "10"))
+
+
+def hand_to_pbn(hand: Hand) -> str:
+    """Return PBN text representation of the Hand."""
+    return hand.as_text().replace("10", "T")
+
+
+def parse_deal(value: str) -> dict[str, Hand | None]:
+    """Parse value of a Deal tag into hands keyed by seat letter.
+
+    Hands unknown in the deal, given as ``-``, are None.
+    """
+    first, colon, hands_text = value.partition(":")
+    first = first.strip().upper()
+    hand_texts = hands_text.split()
+    if not colon or first not in SEATS or len(hand_texts) != len(SEATS):
+        msg = f"invalid deal {value!r}"
+        raise ValueError(msg)
+    start = SEATS.index(first)
+    hands = {}
+    for offset, text in enumerate(hand_texts):
+        seat = SEATS[(start + offset) % len(SEATS)]
+        hands[seat] = None if text == "-" else hand_from_pbn(text)
+    return {seat: hands[seat] for seat in SEATS}
+
+
+def format_deal(hands: Mapping[str, Hand | None], first: str = "N") -> str:
+    """Return value of a Deal tag for hands keyed by seat letter."""
+    start = SEATS.index(first)
+    seats = [SEATS[(start + offset) % len(SEATS)] for offset in range(len(SEATS))]
+    texts = [
+        "-" if hands.get(seat) is None else hand_to_pbn(hands[seat])
+        for seat in seats
+    ]
+    return f"{first}:{' '.join(texts)}"
+
+
+@dataclass
+class PbnRecord:
+    """One game of a PBN file.
+
+    Tags are kept in the order of the file. Lines following a tag, such as
+    the auction or the play, are kept in ``sections`` under the tag name.
+    """
+
+    tags: dict[str, str] = field(default_factory=dict)
+    sections: dict[str, list[str]] = field(default_factory=dict)
+
+    def hands(self) -> dict[str, Hand | None]:
+        """Return hands of the Deal tag keyed by seat letter."""
+        return parse_deal(self.tags["Deal"])
+
+    def deal(self) -> Deal:
+        """Return the Deal given by the Deal, Dealer and Vulnerable tags."""
+        hands = self.hands()
+        if None in hands.values():
+            msg = "deal has unknown hands"
+            raise ValueError(msg)
+        return Deal(
+            tuple(hands[seat.as_text()] for seat in Seat),
+            Seat.from_text(self.tags.get("Dealer", "N")),
+            Vulnerability.from_text(self.tags.get("Vulnerable", "None")),
+        )
+
+    @classmethod
+    def from_deal(cls: type[PbnRecord], deal: Deal, **tags: str) -> PbnRecord:
+        """Create a record of the Deal, preceded by given tags."""
+        hands = {seat.as_text(): deal.hand(seat) for seat in Seat}
+        return cls(
+            tags={
+                **tags,
+                "Dealer": deal.dealer.as_text(),
+                "Vulnerable": deal.vulnerability.as_text(),
+                "Deal": format_deal(hands, first=deal.dealer.as_text()),
+            }
+        )
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r'\\(.)', r'\1', value)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def pbn_encoding(path: str | os.PathLike) -> str:
+    """Return encoding of a PBN file: UTF-8 when it decodes, else Latin-1.
+
+    PBN 2.1 files are Latin-1, newer ones are often UTF-8 with a byte order
+    mark. The file is checked in chunks, without reading it all at once.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with open(path, "rb") as file:
+        try:
+            while chunk := file.read(_CHUNK_BYTES):
+                decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return "latin-1"
+    return "utf-8-sig"
+
+
+def open_pbn(path: str | os.PathLike, encoding: str | None = None) -> TextIO:
+    """Open a PBN file for reading, detecting its encoding unless given."""
+    if encoding is None:
+        encoding = pbn_encoding(path)
+    return open(path, encoding=encoding)
+
+
+def read_pbn(lines: Iterable[str]) -> Iterator[PbnRecord]:
+    """Read games from lines of a PBN file one by one.
+
+    Only the current game is kept in memory. Lines starting with ``%`` or
+    ``;`` and commentary in braces starting a line are skipped, as is a byte
+    order mark starting the first line.
+    """
+    record = PbnRecord()
+    last_tag = None
+    in_comment = False
+    for number, line in enumerate(lines):
+        text = line.strip()
+        if number == 0:
+            text = text.lstrip("\ufeff")
+        if in_comment:
+            in_comment = "}" not in text
+            continue
+        if text.startswith(("%", ";")):
+            continue
+        if text.startswith("{"):
+            in_comment = "}" not in text
+            continue
+        if not text:
+            if record.tags:
+                yield record
+            record = PbnRecord()
+            last_tag = None
+            continue
+        match = _TAG_RE.match(text)
+        if match:
+            last_tag = match.group(1)
+            record.tags[last_tag] = _unescape(match.group(2))
+        elif last_tag is not None:
+            record.sections.setdefault(last_tag, []).append(text)
+        else:
+            msg = f"unexpected line {text!r}"
+            raise ValueError(msg)
+    if record.tags:
+        yield record
+
+
+def write_pbn(file: TextIO, records: Iterable[PbnRecord]) -> None:
+    """Write games to a PBN file, separated by empty lines."""
+    file.write("% PBN 2.1\n% EXPORT\n")
+    for record in records:
+        file.write("\n")
+        for tag, value in record.tags.items():
+            file.write(f'[{tag} "{_escape(value)}"]\n')
+            for section_line in record.sections.get(tag, []):
+                file.write(f"{section_line}\n")
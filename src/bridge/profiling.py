@@ -0,0 +1,136 @@
+"""Opt-in instrumentation of rule matching and condition evaluation."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from prettytable import PrettyTable
+
+from bridge.conditions import Condition
+from bridge.rules import Rule
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@dataclass
+class CallStats:
+    """Number of calls, positive results and total time of calls."""
+
+    calls: int = 0
+    hits: int = 0
+    time: float = 0.0
+
+    def record(self, result: bool, time: float) -> None:
+        self.calls += 1
+        self.hits += result
+        self.time += time
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.calls if self.calls else 0.0
+
+
+class Profiler:
+    """Statistics of Rule.match and Condition.evaluate calls.
+
+    Conditions are recorded separately for every rule evaluating them.
+    """
+
+    def __init__(self):
+        self.rules: dict[int, tuple[Rule, CallStats]] = {}
+        self.conditions: dict[
+            tuple[int, int], tuple[Rule | None, Condition, CallStats]
+        ] = {}
+        self._current: list[Rule] = []
+
+    def rule_stats(self, rule: Rule) -> CallStats:
+        """Return statistics of matching a given rule."""
+        return self.rules.setdefault(id(rule), (rule, CallStats()))[1]
+
+    def condition_stats(self, rule: Rule | None, condition: Condition) -> CallStats:
+        """Return statistics of evaluating a condition when matching a rule."""
+        key = (id(rule), id(condition))
+        return self.conditions.setdefault(key, (rule, condition, CallStats()))[2]
+
+    def _match(self, match, rule: Rule, hand) -> bool:
+        self._current.append(rule)
+        start = perf_counter()
+        try:
+            result = match(rule, hand)
+        finally:
+            self._current.pop()
+        self.rule_stats(rule).record(result, perf_counter() - start)
+        return result
+
+    def _evaluate(self, evaluate, condition: Condition, hand) -> bool:
+        start = perf_counter()
+        result = evaluate(condition, hand)
+        rule = self._current[-1] if self._current else None
+        self.condition_stats(rule, condition).record(result, perf_counter() - start)
+        return result
+
+    def table(self) -> PrettyTable:
+        """Return a table of rules, each followed by its conditions."""
+        table = PrettyTable()
+        table.field_names = ["Rule", "Condition", "Calls", "Hit rate", "Time [ms]"]
+        table.align["Rule"] = 'l'
+        table.align["Condition"] = 'l'
+        for field in table.field_names[2:]:
+            table.align[field] = 'r'
+
+        def add_row(rule_text, condition_text, stats):
+            table.add_row(
+                [
+                    rule_text,
+                    condition_text,
+                    stats.calls,
+                    f"{100 * stats.hit_rate:.2f}%",
+                    f"{1000 * stats.time:.1f}",
+                ]
+            )
+
+        for rule, stats in self.rules.values():
+            add_row(rule.as_text(), "", stats)
+            for cond_rule, condition, cond_stats in self.conditions.values():
+                if cond_rule is rule:
+                    kind = (
+                        "" if any(c is condition for c in rule.require) else "not "
+                    )
+                    add_row("", kind + condition.describe(), cond_stats)
+        for cond_rule, condition, cond_stats in self.conditions.values():
+            if cond_rule is None:
+                add_row("-", condition.describe(), cond_stats)
+        return table
+
+    def print(self) -> None:
+        print(self.table())
+
+
+@contextmanager
+def profiling() -> Iterator[Profiler]:
+    """Record statistics of Rule.match and Condition.evaluate within the block.
+
+    The methods are replaced only for the duration of the block, so there is
+    no overhead outside of it.
+    """
+    profiler = Profiler()
+    match = Rule.match
+    evaluate = Condition.evaluate
+
+    def profiled_match(rule, hand):
+        return profiler._match(match, rule, hand)
+
+    def profiled_evaluate(condition, hand):
+        return profiler._evaluate(evaluate, condition, hand)
+
+    Rule.match = profiled_match
+    Condition.evaluate = profiled_evaluate
+    try:
+        yield profiler
+    finally:
+        Rule.match = match
+        Condition.evaluate = evaluate
@@ -31,9 +31,9 @@ class Rule:
 
     def match(self, hand):
         """Match the rule against a given hand."""
-        required_match = all(cond.evaluate(hand) for cond in self.require)
-        excluded_match = all(not cond.evaluate(hand) for cond in self.exclude)
-        return required_match and excluded_match
+        return all(cond.evaluate(hand) for cond in self.require) and not any(
+            cond.evaluate(hand) for cond in self.exclude
+        )
 
     def as_text(self) -> str:
         text = self.bid.as_text()
@@ -0,0 +1,227 @@
+"""Duplicate scoring of contracts and par results of deals."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Mapping, Sequence
+
+import numpy as np
+
+from bridge.bid import Bid, Trump
+from bridge.deal import Seat, Vulnerability
+
+if TYPE_CHECKING:
+    from bridge.deal import Deal
+
+MAX_LEVEL = 7
+NUM_TRICKS = 13
+BOOK = 6
+"""Tricks the declarer takes before counting the level of a contract."""
+
+
+class Doubling(Enum):
+    """Doubling of a contract."""
+
+    UNDOUBLED = 0
+    DOUBLED = 1
+    REDOUBLED = 2
+
+    @classmethod
+    def __strings(cls):
+        return ('', 'X', 'XX')
+
+    def as_text(self) -> str:
+        return Doubling.__strings()[self.value]
+
+
+def _contract_score(
+    level: int, trump: Trump, doubling: int, vulnerable: bool, tricks: int
+) -> int:
+    """Return the declarer's score of a contract, computed by the rules."""
+    multiplier = 1 << doubling
+    if tricks < level + BOOK:
+        down = level + BOOK - tricks
+        if not doubling:
+            return -down * (100 if vulnerable else 50)
+        if vulnerable:
+            penalty = 200 + 300 * (down - 1)
+        else:
+            penalty = 100 + 200 * min(down - 1, 2) + 300 * max(down - 3, 0)
+        return -penalty * multiplier // 2
+
+    trick_value = 20 if trump in (Trump.CLUB, Trump.DIAMOND) else 30
+    first_bonus = 10 if trump == Trump.NOTRUMP else 0
+    contract_points = (trick_value * level + first_bonus) * multiplier
+    if contract_points >= 100:
+        bonus = 500 if vulnerable else 300
+    else:
+        bonus = 50
+    if level == MAX_LEVEL - 1:
+        bonus += 750 if vulnerable else 500
+    elif level == MAX_LEVEL:
+        bonus += 1500 if vulnerable else 1000
+    bonus += 50 * doubling
+    overtricks = tricks - level - BOOK
+    if doubling:
+        overtrick_value = (200 if vulnerable else 100) * doubling
+    else:
+        overtrick_value = trick_value
+    return contract_points + bonus + overtricks * overtrick_value
+
+
+SCORES = np.array(
+    [
+        [
+            [
+                [
+                    [
+                        _contract_score(
+                            level, trump, doubling.value, vulnerable, tricks
+                        )
+                        for tricks in range(NUM_TRICKS + 1)
+                    ]
+                    for vulnerable in (False, True)
+                ]
+                for doubling in Doubling
+            ]
+            for trump in Trump
+        ]
+        for level in range(1, MAX_LEVEL + 1)
+    ],
+    dtype=np.int32,
+)
+"""Declarer's scores indexed by level - 1, trump, doubling, vulnerability and
+tricks taken by the declarer."""
+
+
+def score(
+    bid: Bid,
+    tricks: int,
+    doubling: Doubling = Doubling.UNDOUBLED,
+    vulnerable: bool = False,
+) -> int:
+    """Return the declarer's score of a contract taking a number of tricks."""
+    return int(
+        SCORES[
+            bid.count - 1, bid.trump.value, doubling.value, int(vulnerable), tricks
+        ]
+    )
+
+
+def scores(
+    levels: np.ndarray,
+    trumps: np.ndarray,
+    doublings: np.ndarray,
+    vulnerable: np.ndarray,
+    tricks: np.ndarray,
+) -> np.ndarray:
+    """Return declarer's scores of many contracts at once.
+
+    Arguments are broadcast arrays of levels, trump and doubling values,
+    vulnerability and tricks taken by the declarer.
+    """
+    return SCORES[
+        np.asarray(levels) - 1,
+        trumps,
+        doublings,
+        np.asarray(vulnerable, dtype=np.intp),
+        tricks,
+    ]
+
+
+ALL_BIDS = tuple(
+    Bid(level, trump) for level in range(1, MAX_LEVEL + 1) for trump in Trump
+)
+"""Contract bids from the lowest to the highest."""
+
+
+@dataclass(frozen=True)
+class Par:
+    """Par result of a deal, with the score of North-South.
+
+    The contract is None when the deal is passed out. Contracts going down
+    are doubled.
+    """
+
+    score: int
+    contract: Bid | None = None
+    declarer: Seat | None = None
+    doubling: Doubling = Doubling.UNDOUBLED
+
+    def as_text(self) -> str:
+        """Return text representation of the result, like ``4SX-W -300``."""
+        if self.contract is None:
+            return "Pass 0"
+        contract = self.contract.as_text() + self.doubling.as_text()
+        return f"{contract}-{self.declarer.as_text()} {self.score:+d}"
+
+
+def par(
+    tricks: Mapping[Trump, Sequence[int]],
+    dealer: Seat = Seat.NORTH,
+    vulnerability: Vulnerability = Vulnerability.NONE,
+) -> Par:
+    """Return the par result of a deal from double-dummy tricks.
+
+    Tricks of every strain are indexed by the Seat value of the declarer, as
+    returned by ``solver.solve_all``. The auction is solved by backward
+    induction over contracts from the highest one: a side either accepts
+    the last contract of the opponents, doubled when it goes down, or bids
+    a higher one. The side of the dealer speaks first. Of equal results,
+    sides prefer passing and the lowest contract.
+    """
+    seats = [dealer.next(offset) for offset in range(len(Seat))]
+    # results of contracts by bid index and declaring side
+    contracts = [[None, None] for _ in ALL_BIDS]
+    for index, bid in enumerate(ALL_BIDS):
+        strain_tricks = tricks[bid.trump]
+        for side in (0, 1):
+            declarer = max(
+                (seat for seat in seats if seat.value % 2 == side),
+                key=lambda seat: strain_tricks[seat.value],
+            )
+            taken = strain_tricks[declarer.value]
+            vulnerable = vulnerability.is_vulnerable(declarer)
+            doubling = Doubling.UNDOUBLED
+            if score(bid, taken, doubling, vulnerable) < 0:
+                doubling = Doubling.DOUBLED
+            value = score(bid, taken, doubling, vulnerable)
+            contracts[index][side] = Par(
+                -value if side else value, bid, declarer, doubling
+            )
+
+    def better(side, value, other):
+        return value < other if side else value > other
+
+    # best outcome of bidding above the current contract, for each side
+    outbids = [None, None]
+    for index in reversed(range(len(ALL_BIDS))):
+        # outcomes when a side is to speak over the contract of the opponents
+        outcomes = []
+        for side in (0, 1):
+            outcome = contracts[index][1 - side]
+            outbid = outbids[side]
+            if outbid is not None and better(side, outbid.score, outcome.score):
+                outcome = outbid
+            outcomes.append(outcome)
+        for side in (0, 1):
+            outcome = outcomes[1 - side]
+            if outbids[side] is None or not better(
+                side, outbids[side].score, outcome.score
+            ):
+                outbids[side] = outcome
+
+    first = dealer.value % 2
+    second = 1 - first
+    result = Par(0)
+    if better(second, outbids[second].score, result.score):
+        result = outbids[second]
+    if better(first, outbids[first].score, result.score):
+        result = outbids[first]
+    return result
+
+
+def deal_par(deal: Deal, tricks: Mapping[Trump, Sequence[int]]) -> Par:
+    """Return the par result of a Deal from its double-dummy tricks."""
+    return par(tricks, deal.dealer, deal.vulnerability)
@@ -0,0 +1,231 @@
+"""Statistics of opening bids over dealt, counted or recorded hands."""
+
+from __future__ import annotations
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, repeat
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+
+from bridge.batch import (
+    POINTS_FEATURE,
+    deal,
+    features,
+    match_matrix,
+    opening_matrix,
+)
+from bridge.bidding import all_openings
+from bridge.dealer import deal_hands
+from bridge.distribution import match_counts
+from bridge.lookup import RuleTable
+from bridge.pbn import open_pbn, read_pbn
+from bridge.profiling import profiling
+from bridge.stats import BidStats
+from bridge.storage import DealFile
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from bridge.cards import Hand
+    from bridge.profiling import Profiler
+    from bridge.rules import Rule
+
+CHUNK_HANDS = 100_000
+"""Number of hands dealt with one seed of a simulation."""
+
+openings_table = RuleTable(all_openings)
+
+
+def matching_openings(hand: Hand) -> Iterable[Rule]:
+    """Return opening rules matching the Hand."""
+    return openings_table.match(hand)
+
+
+def exact_stats(min_points: int) -> tuple[BidStats, int]:
+    """Count openings of all possible hands with at least ``min_points``."""
+    stats = BidStats()
+    for indices, count in match_counts(openings_table, min_points).items():
+        stats.record([openings_table.rules[i] for i in indices], count)
+    return stats, stats.total
+
+
+def batch_stats(
+    num_hands: int,
+    min_points: int,
+    rng: np.random.Generator,
+    batch_size: int = 100_000,
+) -> BidStats:
+    """Deal hands with at least ``min_points`` in arrays and count openings."""
+    stats = BidStats()
+    while num_hands > 0:
+        deals = deal(batch_size // 4, rng)
+        hands = np.concatenate([features(deals == seat) for seat in range(4)])
+        hands = hands[hands[:, POINTS_FEATURE] >= min_points][:num_hands]
+        stats.record_matrix(all_openings, match_matrix(all_openings, hands))
+        num_hands -= len(hands)
+    return stats
+
+
+def seat_stats(
+    num_deals: int, rng: np.random.Generator, batch_size: int = 25_000
+) -> BidStats:
+    """Deal whole deals in arrays and count openings of the first seat."""
+    stats = BidStats()
+    while num_deals > 0:
+        deals = deal(min(batch_size, num_deals), rng)
+        stats.record_openings(all_openings, *opening_matrix(all_openings, deals))
+        num_deals -= len(deals)
+    return stats
+
+
+def simulate_chunk(
+    num_hands: int,
+    min_points: int,
+    seed: np.random.SeedSequence,
+    batch: bool,
+    seats: bool = False,
+) -> BidStats:
+    """Deal one chunk of a simulation from its own seed."""
+    if seats:
+        return seat_stats(num_hands, np.random.default_rng(seed))
+    if batch:
+        return batch_stats(num_hands, min_points, np.random.default_rng(seed))
+    rng = random.Random(int(seed.generate_state(1)[0]))
+    stats = BidStats()
+    for hand in deal_hands(num_hands, min_points, rng):
+        stats.record(list(matching_openings(hand)))
+    return stats
+
+
+def simulate_chunks(jobs: int, *chunk_args: Iterable) -> Iterator[BidStats]:
+    """Deal chunks in order, in parallel with more than one job.
+
+    Chunks not dealt yet are cancelled when iteration stops early.
+    """
+    if jobs == 1:
+        yield from map(simulate_chunk, *chunk_args)
+        return
+    pool = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        yield from pool.map(simulate_chunk, *chunk_args)
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def simulate(
+    num_hands: int,
+    min_points: int,
+    seed: int | None = None,
+    jobs: int = 1,
+    batch: bool = False,
+    shard: tuple[int, int] = (0, 1),
+    checkpoint: str | os.PathLike | None = None,
+    checkpoint_every: int = 10,
+    tolerance: float | None = None,
+    seats: bool = False,
+) -> BidStats:
+    """Deal hands in chunks of fixed size, each chunk with its own seed.
+
+    With ``seats``, whole deals are dealt instead of hands, and the first
+    seat from the dealer with an opening bid is recorded.
+
+    Results for a given seed are the same for any number of parallel jobs.
+    A shard ``(index, count)`` deals only every count-th chunk, starting at
+    index. With a checkpoint file, statistics are saved every few chunks and
+    a run with the same parameters resumes from the saved state.
+    With a tolerance, dealing stops early once all 95% confidence intervals
+    are narrower than the tolerance.
+    """
+    chunks = [
+        min(CHUNK_HANDS, num_hands - start)
+        for start in range(0, num_hands, CHUNK_HANDS)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    index, count = shard
+    chunks = chunks[index::count]
+    seeds = seeds[index::count]
+
+    info = {
+        "num_hands": num_hands,
+        "min_points": min_points,
+        "seed": seed,
+        "batch": batch,
+        "shard": list(shard),
+        "seats": seats,
+    }
+    stats = BidStats()
+    stats.info = info
+    if checkpoint is not None and os.path.exists(checkpoint):
+        stats = BidStats.load(checkpoint)
+        if stats.info != info:
+            msg = f"checkpoint {checkpoint!r} was saved with other parameters"
+            raise ValueError(msg)
+        ends = list(accumulate(chunks, initial=0))
+        if stats.total not in ends:
+            msg = f"checkpoint {checkpoint!r} does not end on a chunk"
+            raise ValueError(msg)
+        done = ends.index(stats.total)
+        chunks = chunks[done:]
+        seeds = seeds[done:]
+
+    chunk_args = (chunks, repeat(min_points), seeds, repeat(batch), repeat(seats))
+    results = simulate_chunks(jobs, *chunk_args)
+    for done, chunk_stats in enumerate(results, start=1):
+        stats.merge(chunk_stats)
+        if checkpoint is not None and done % checkpoint_every == 0:
+            stats.save(checkpoint)
+        if tolerance is not None and stats.converged(tolerance):
+            break
+    if checkpoint is not None:
+        stats.save(checkpoint)
+    return stats
+
+
+def profiled_stats(
+    num_hands: int, min_points: int, seed: int | None
+) -> tuple[BidStats, Profiler]:
+    """Deal hands matching rules one by one, and profile the matching."""
+    rng = random.Random(seed)
+    stats = BidStats()
+    with profiling() as profiler:
+        for hand in deal_hands(num_hands, min_points, rng):
+            stats.record([rule for rule in all_openings if rule.match(hand)])
+    return stats, profiler
+
+
+def pbn_stats(
+    path: str | os.PathLike,
+    min_points: int,
+    seats: bool = False,
+    encoding: str | None = None,
+) -> BidStats:
+    """Count openings of hands, or with ``seats`` of deals, in a PBN file.
+
+    With ``seats``, deals with unknown hands are skipped. The encoding of
+    the file is detected unless given.
+    """
+    stats = BidStats()
+    with open_pbn(path, encoding) as file:
+        for record in read_pbn(file):
+            hands = record.hands()
+            if seats:
+                if None not in hands.values():
+                    stats.record_deal(record.deal(), matching_openings)
+                continue
+            for hand in hands.values():
+                if hand is not None and hand.points() >= min_points:
+                    stats.record(list(matching_openings(hand)))
+    return stats
+
+
+def deal_file_stats(path: str | os.PathLike, min_points: int) -> BidStats:
+    """Count openings of hands with at least ``min_points`` in a deal file."""
+    stats = BidStats()
+    for deals in DealFile(path).batches():
+        hands = np.concatenate([features(deals == seat) for seat in range(4)])
+        hands = hands[hands[:, POINTS_FEATURE] >= min_points]
+        stats.record_matrix(all_openings, match_matrix(all_openings, hands))
+    return stats
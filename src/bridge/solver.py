@@ -0,0 +1,545 @@
+"""Double-dummy solver finding the number of tricks with all hands visible.
+
+Full deals are solved by the compiled DDS library of the ``endplay``
+package. Endings with fewer cards are solved by a pure-Python search.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence
+
+from endplay import dds
+from endplay.types import Deal as DdsDeal
+from endplay.types import Denom
+
+from bridge.bid import Trump
+from bridge.cards import SUIT_SIZE, Suit, holding_length
+from bridge.deal import Seat
+
+if TYPE_CHECKING:
+    from bridge.cards import Card
+
+DDS_BATCH = 32
+"""Number of deals solved by one call of the DDS library."""
+
+_NUM_SEATS = len(Seat)
+_SUITS = range(len(Suit))
+_NO_RANKS = (0, 0, 0, 0)
+_LENGTHS = tuple(map(holding_length, range(1 << SUIT_SIZE)))
+
+Play = tuple[int, int, int]
+"""Card played to a trick, as seat, suit and rank values."""
+
+Ranks = tuple[int, int, int, int]
+"""Masks of card ranks by suit value."""
+
+Table = dict[Trump, tuple[int, int, int, int]]
+"""Tricks of the declarer's side by strain and Seat value of the declarer."""
+
+# rows of DDS tables, which list strains from spades to notrump
+_DDS_ROWS = (3, 2, 1, 0, 4)
+_PBN_RANKS = "23456789TJQKA"
+
+
+def _groups(holding: int, present: int) -> list[int]:
+    """Return the lowest rank of every group of equivalent cards in a holding.
+
+    Cards of one hand are equivalent when all cards of the suit ranked between
+    them have been played. Groups are listed from the highest one.
+    """
+    others = present & ~holding
+    result = []
+    while holding:
+        top = holding.bit_length() - 1
+        stop = (others & ((1 << top) - 1)).bit_length()
+        group = holding >> stop << stop
+        result.append((group & -group).bit_length() - 1)
+        holding &= (1 << stop) - 1
+    return result
+
+
+def _top_cards(present: int, count: int) -> int:
+    """Return the mask of ``count`` highest cards of a suit."""
+    result = 0
+    for _ in range(count):
+        bit = 1 << (present.bit_length() - 1)
+        result |= bit
+        present ^= bit
+    return result
+
+
+def _winner(trick: Sequence[Play], trump: int) -> Play:
+    best = trick[0]
+    for play in trick[1:]:
+        if play[1] == best[1]:
+            if play[2] > best[2]:
+                best = play
+        elif play[1] == trump:
+            best = play
+    return best
+
+
+class DoubleDummy:
+    """Double-dummy analysis of one deal.
+
+    Hands are given in Seat order and must have the same number of cards,
+    so endings with fewer than 13 cards can be solved too. The search is
+    pure Python, so it is much slower on full deals than DDS, and solves
+    endings and serves as the reference for ``solve`` and related functions.
+
+    Searches answer whether a side can take a number of tricks, and the
+    result is found by bisection. Positions at the start of a trick are kept
+    in a transposition table shared by all declarers of a strain. An entry
+    keeps only the cards which decided the search, so it also applies to
+    positions differing in cards too low to matter.
+    """
+
+    def __init__(self, hands: Sequence[Iterable[Card]]):
+        if len(hands) != _NUM_SEATS:
+            msg = f"expecting exactly {_NUM_SEATS} hands"
+            raise ValueError(msg)
+        self._hands = [[0] * len(Suit) for _ in Seat]
+        seen = set()
+        lengths = set()
+        for seat, hand in enumerate(hands):
+            cards = list(hand)
+            for card in cards:
+                if card in seen:
+                    msg = f"{card!r} is in more than one hand"
+                    raise ValueError(msg)
+                seen.add(card)
+                self._hands[seat][card.suit.value] |= 1 << card.rank.value
+            lengths.add(len(cards))
+        if len(lengths) != 1:
+            msg = "hands must have the same number of cards"
+            raise ValueError(msg)
+        self.num_tricks = lengths.pop()
+        self.nodes = 0
+        self._tables: dict[Trump, dict[tuple, list]] = {}
+        self._lead_tables: dict[Trump, dict[tuple, tuple[int, int]]] = {}
+        self._suit_codes: dict[tuple[int, int, int, int], int] = {}
+        self._table: dict[tuple, list] = {}
+        self._leads: dict[tuple, tuple[int, int]] = {}
+        self._trump = -1
+        self._side = 0
+
+    def tricks(self, trump: Trump, declarer: Seat) -> int:
+        """Return the number of tricks taken by the declarer's side."""
+        leader = declarer.next()
+        tricks = self._side_tricks(trump, leader.value)
+        if leader.value % 2 == declarer.value % 2:
+            return tricks
+        return self.num_tricks - tricks
+
+    def declarer_tricks(self, trump: Trump) -> tuple[int, int, int, int]:
+        """Return tricks of the declarer's side for every declarer Seat."""
+        return tuple(self.tricks(trump, declarer) for declarer in Seat)
+
+    def table(self) -> dict[Trump, tuple[int, int, int, int]]:
+        """Return tricks of every strain and declarer, indexed by Seat value."""
+        return {trump: self.declarer_tricks(trump) for trump in Trump}
+
+    def _side_tricks(self, trump: Trump, leader: int) -> int:
+        """Return tricks of the side of the leader, found by bisection."""
+        self._trump = trump.value if trump != Trump.NOTRUMP else -1
+        self._table = self._tables.setdefault(trump, {})
+        self._leads = self._lead_tables.setdefault(trump, {})
+        self._side = leader % 2
+        lower, upper = 0, self.num_tricks
+        while lower < upper:
+            target = (lower + upper + 1) // 2
+            if self._boundary(target, leader)[0]:
+                lower = target
+            else:
+                upper = target - 1
+        return lower
+
+    def _suit_code(self, holdings: tuple[int, int, int, int]) -> int:
+        """Return owners of cards of a suit from the highest, two bits each.
+
+        The code starts with a set bit, so that suits of different lengths
+        have different codes.
+        """
+        code = self._suit_codes.get(holdings)
+        if code is None:
+            code = 1
+            present = holdings[0] | holdings[1] | holdings[2] | holdings[3]
+            while present:
+                bit = 1 << (present.bit_length() - 1)
+                owner = 0
+                while not holdings[owner] & bit:
+                    owner += 1
+                code = code << 2 | owner
+                present ^= bit
+            self._suit_codes[holdings] = code
+        return code
+
+    def _boundary(self, needed: int, leader: int) -> tuple[bool, Ranks]:
+        """Check whether the searched side can take ``needed`` more tricks.
+
+        Return the result and the ranks of cards which decided it. Bounds of
+        North-South tricks are kept in the transposition table, so that
+        searches for both sides share it.
+        """
+        hands = self._hands
+        lengths = _LENGTHS
+        north, east, south, west = hands
+        remaining = (
+            lengths[north[0]]
+            + lengths[north[1]]
+            + lengths[north[2]]
+            + lengths[north[3]]
+        )
+        if needed <= 0:
+            return True, _NO_RANKS
+        if needed > remaining:
+            return False, _NO_RANKS
+        side = self._side
+        presents = []
+        counts = []
+        codes = []
+        for suit in _SUITS:
+            holdings = (north[suit], east[suit], south[suit], west[suit])
+            present = holdings[0] | holdings[1] | holdings[2] | holdings[3]
+            presents.append(present)
+            counts.append(lengths[present])
+            code = self._suit_codes.get(holdings)
+            codes.append(self._suit_code(holdings) if code is None else code)
+        # owners of relative ranks are compared only for cards which matter,
+        # so the key has just the leader and lengths of suits in every hand
+        key = (
+            leader,
+            lengths[north[0]],
+            lengths[north[1]],
+            lengths[north[2]],
+            lengths[north[3]],
+            lengths[east[0]],
+            lengths[east[1]],
+            lengths[east[2]],
+            lengths[east[3]],
+            lengths[south[0]],
+            lengths[south[1]],
+            lengths[south[2]],
+            lengths[south[3]],
+            *counts,
+        )
+        entries = self._table.get(key)
+        if entries is None:
+            entries = self._table[key] = []
+        for tops, prefixes, lower, upper in entries:
+            if (
+                codes[0] >> 2 * (counts[0] - tops[0]) == prefixes[0]
+                and codes[1] >> 2 * (counts[1] - tops[1]) == prefixes[1]
+                and codes[2] >> 2 * (counts[2] - tops[2]) == prefixes[2]
+                and codes[3] >> 2 * (counts[3] - tops[3]) == prefixes[3]
+            ):
+                if side:
+                    lower, upper = remaining - upper, remaining - lower
+                if lower >= needed or upper < needed:
+                    ranks = tuple(map(_top_cards, presents, tops))
+                    return lower >= needed, ranks
+
+        quick_tricks, ranks = self._quick_tricks(leader, presents)
+        if leader % 2 == side and quick_tricks >= needed:
+            return True, ranks
+        if leader % 2 != side and remaining - quick_tricks < needed:
+            return False, ranks
+        trump = self._trump
+        if trump >= 0 and presents[trump]:
+            # top trumps in one hand win tricks whenever they are played
+            present = presents[trump]
+            owner = 0
+            top = 1 << (present.bit_length() - 1)
+            while not hands[owner][trump] & top:
+                owner += 1
+            others = present & ~hands[owner][trump]
+            count = lengths[hands[owner][trump] >> others.bit_length()]
+            ranks = tuple(
+                _top_cards(present, count) if suit == trump else 0 for suit in _SUITS
+            )
+            if owner % 2 == side and count >= needed:
+                return True, ranks
+            if owner % 2 != side and remaining - count < needed:
+                return False, ranks
+
+        result, ranks = self._play(needed, [], leader, (leader, *codes))
+        if result:
+            lower, upper = needed, remaining
+        else:
+            lower, upper = 0, needed - 1
+        if side:
+            lower, upper = remaining - upper, remaining - lower
+        tops = tuple(
+            lengths[present >> ((mask & -mask).bit_length() - 1)] if mask else 0
+            for present, mask in zip(presents, ranks)
+        )
+        prefixes = tuple(
+            code >> 2 * (count - top)
+            for code, count, top in zip(codes, counts, tops)
+        )
+        entries.append((tops, prefixes, lower, upper))
+        return result, ranks
+
+    def _quick_tricks(self, leader: int, presents: list[int]) -> tuple[int, Ranks]:
+        """Return tricks the leader can take at once by cashing top cards.
+
+        Top cards of a side suit count only as long as opponents holding
+        trumps have to follow suit.
+        """
+        hands = self._hands
+        hand = hands[leader]
+        trump = self._trump
+        opponents = [
+            hands[seat]
+            for seat in ((leader + 1) % _NUM_SEATS, (leader + 3) % _NUM_SEATS)
+            if trump >= 0 and hands[seat][trump]
+        ]
+        result = 0
+        ranks = [0, 0, 0, 0]
+        for suit in _SUITS:
+            holding = hand[suit]
+            if not holding:
+                continue
+            others = presents[suit] & ~holding
+            count = _LENGTHS[holding >> others.bit_length()]
+            if suit != trump:
+                for opponent in opponents:
+                    count = min(count, _LENGTHS[opponent[suit]])
+            if count:
+                result += count
+                ranks[suit] = _top_cards(holding, count)
+        return result, tuple(ranks)
+
+    def _play(
+        self, needed: int, trick: list[Play], player: int, lead_key: tuple = ()
+    ) -> tuple[bool, Ranks]:
+        self.nodes += 1
+        if len(trick) == _NUM_SEATS:
+            best = _winner(trick, self._trump)
+            winner, suit, rank = best
+            result, ranks = self._boundary(
+                needed - (winner % 2 == self._side), winner
+            )
+            # the winning card counts if it beat other cards of its suit
+            if any(play[1] == suit and play is not best for play in trick):
+                ranks = tuple(
+                    mask | (1 << rank if index == suit else 0)
+                    for index, mask in enumerate(ranks)
+                )
+            return result, ranks
+
+        maximizing = player % 2 == self._side
+        hand = self._hands[player]
+        following = (player + 1) % _NUM_SEATS
+        moves = self._moves(player, trick)
+        if lead_key:
+            best_lead = self._best_lead(lead_key)
+            if best_lead in moves:
+                moves.remove(best_lead)
+                moves.insert(0, best_lead)
+        clubs = diamonds = hearts = spades = 0
+        for suit, rank in moves:
+            bit = 1 << rank
+            hand[suit] ^= bit
+            trick.append((player, suit, rank))
+            result, ranks = self._play(needed, trick, following)
+            trick.pop()
+            hand[suit] ^= bit
+            if result == maximizing:
+                if lead_key:
+                    self._store_lead(lead_key, suit, rank)
+                return result, ranks
+            clubs |= ranks[0]
+            diamonds |= ranks[1]
+            hearts |= ranks[2]
+            spades |= ranks[3]
+        return not maximizing, (clubs, diamonds, hearts, spades)
+
+    def _present(self, suit: int) -> int:
+        hands = self._hands
+        return hands[0][suit] | hands[1][suit] | hands[2][suit] | hands[3][suit]
+
+    def _best_lead(self, lead_key: tuple) -> tuple[int, int] | None:
+        """Return the lead which decided an earlier search of the position.
+
+        Leads are kept by rank relative to cards not played yet, so they
+        apply to every position with the same owners of relative ranks.
+        """
+        lead = self._leads.get(lead_key)
+        if lead is None:
+            return None
+        suit, above = lead
+        present = self._present(suit)
+        present &= ~_top_cards(present, above)
+        return suit, present.bit_length() - 1
+
+    def _store_lead(self, lead_key: tuple, suit: int, rank: int) -> None:
+        above = _LENGTHS[self._present(suit) >> (rank + 1)]
+        self._leads[lead_key] = (suit, above)
+
+    def _leads_of(self, player: int) -> list[tuple[int, int]]:
+        """Return leads of a player, suits most likely to win tricks first.
+
+        Top cards are cashed, other suits are led low, preferably towards
+        partner's top card or a ruff, and not into a ruff of an opponent.
+        """
+        hands = self._hands
+        hand = hands[player]
+        partner = hands[(player + 2) % _NUM_SEATS]
+        left = hands[(player + 1) % _NUM_SEATS]
+        right = hands[(player + 3) % _NUM_SEATS]
+        trump = self._trump
+        scored = []
+        for suit in _SUITS:
+            holding = hand[suit]
+            if not holding:
+                continue
+            present = left[suit] | right[suit] | partner[suit] | holding
+            ranks = _groups(holding, present)
+            top = 1 << (present.bit_length() - 1)
+            if holding & top:
+                score = 4
+                suit_moves = [(suit, ranks[0])]
+                suit_moves += [(suit, rank) for rank in reversed(ranks[1:])]
+            else:
+                score = 3 if partner[suit] & top else 0
+                suit_moves = [(suit, rank) for rank in reversed(ranks)]
+            if trump >= 0 and suit != trump:
+                if not partner[suit] and partner[trump]:
+                    score += 2
+                if (not left[suit] and left[trump]) or (
+                    not right[suit] and right[trump]
+                ):
+                    score -= 3
+            scored.append((-score, suit, suit_moves))
+        scored.sort()
+        return [move for _, _, suit_moves in scored for move in suit_moves]
+
+    def _moves(self, player: int, trick: list[Play]) -> list[tuple[int, int]]:
+        """Return cards worth playing, best guesses first."""
+        hands = self._hands
+        hand = hands[player]
+        trump = self._trump
+
+        def present(suit):
+            result = (
+                hands[0][suit] | hands[1][suit] | hands[2][suit] | hands[3][suit]
+            )
+            for _, played_suit, rank in trick:
+                if played_suit == suit:
+                    result |= 1 << rank
+            return result
+
+        if not trick:
+            return self._leads_of(player)
+
+        led = trick[0][1]
+        best = _winner(trick, trump)
+        partner_wins = best[0] == (player + 2) % _NUM_SEATS
+        if hand[led]:
+            ranks = sorted(_groups(hand[led], present(led)))
+            if best[1] != led or len(trick) == 1:
+                return [(led, rank) for rank in ranks]
+            if partner_wins:
+                if len(trick) == 3:
+                    return [(led, rank) for rank in ranks]
+                # third hand covers when the last hand could beat partner
+                last = hands[(player + 1) % _NUM_SEATS]
+                beat = max(best[2], last[led].bit_length() - 1)
+                if beat == best[2]:
+                    return [(led, rank) for rank in ranks]
+            else:
+                beat = best[2]
+            winning = [rank for rank in ranks if rank > beat]
+            losing = [rank for rank in ranks if rank < beat]
+            return [(led, rank) for rank in winning + losing]
+
+        discards = []
+        ruffs = []
+        for suit in _SUITS:
+            if not hand[suit]:
+                continue
+            ranks = sorted(_groups(hand[suit], present(suit)))
+            if suit == trump:
+                ruffs += [
+                    (suit, rank)
+                    for rank in ranks
+                    if best[1] != trump or rank > best[2]
+                ]
+                discards += [
+                    (suit, rank)
+                    for rank in ranks
+                    if best[1] == trump and rank < best[2]
+                ]
+            else:
+                discards += [(suit, rank) for rank in ranks]
+        discards.sort(key=lambda move: move[1])
+        if partner_wins:
+            return discards + ruffs
+        return ruffs + discards
+
+
+def _uses_dds(solver: DoubleDummy) -> bool:
+    return solver.num_tricks == SUIT_SIZE
+
+
+def _dds_deal(solver: DoubleDummy) -> DdsDeal:
+    """Return the deal of a solver in the form taken by the DDS library."""
+    texts = []
+    for holdings in solver._hands:
+        suits = (
+            "".join(
+                _PBN_RANKS[rank]
+                for rank in reversed(range(SUIT_SIZE))
+                if holdings[suit] >> rank & 1
+            )
+            for suit in reversed(_SUITS)
+        )
+        texts.append(".".join(suits))
+    return DdsDeal(f"N:{' '.join(texts)}")
+
+
+def _dds_table(rows: list[list[int]]) -> Table:
+    return {trump: tuple(rows[_DDS_ROWS[trump.value]]) for trump in Trump}
+
+
+def solve(
+    hands: Sequence[Iterable[Card]], trump: Trump
+) -> tuple[int, int, int, int]:
+    """Return tricks of the declarer's side for every declarer Seat."""
+    solver = DoubleDummy(hands)
+    if not _uses_dds(solver):
+        return solver.declarer_tricks(trump)
+    row = _DDS_ROWS[trump.value]
+    exclude = [denom for denom in Denom if denom.value != row]
+    (table,) = dds.calc_all_tables([_dds_deal(solver)], exclude=exclude)
+    return tuple(table.to_list()[row])
+
+
+def solve_all(hands: Sequence[Iterable[Card]]) -> Table:
+    """Return tricks of all 20 combinations of strain and declarer.
+
+    In searches of endings, those of one strain share a transposition table.
+    """
+    solver = DoubleDummy(hands)
+    if not _uses_dds(solver):
+        return solver.table()
+    return _dds_table(dds.calc_dd_table(_dds_deal(solver)).to_list())
+
+
+def solve_deals(deals: Iterable[Sequence[Iterable[Card]]]) -> Iterator[Table]:
+    """Return tricks of all strains and declarers of many deals, in order.
+
+    DDS solves full deals in batches of ``DDS_BATCH``, using all cores.
+    """
+    deals = iter(deals)
+    while batch := list(islice(deals, DDS_BATCH)):
+        solvers = [DoubleDummy(hands) for hands in batch]
+        full = [_dds_deal(solver) for solver in solvers if _uses_dds(solver)]
+        tables = iter(dds.calc_all_tables(full) if full else ())
+        for solver in solvers:
+            if _uses_dds(solver):
+                yield _dds_table(next(tables).to_list())
+            else:
+                yield solver.table()
@@ -0,0 +1,198 @@
+"""Statistics of bids matching many hands."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from prettytable import PrettyTable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from bridge.cards import Hand
+    from bridge.deal import Deal
+    from bridge.rules import Rule
+
+FORMAT = "3bridge-bidstats"
+VERSION = 1
+
+SEAT_LABELS = ("1st seat", "2nd seat", "3rd seat", "4th seat")
+"""Labels of seats counted from the dealer."""
+
+PASSED_OUT = "passed out"
+
+
+def opening_bids(seat: int | None, matches: Iterable[Rule]) -> frozenset[str]:
+    """Return bids recorded for a deal opened in a seat counted from the dealer.
+
+    Each bid is labelled with the seat, a deal passed out has no seat.
+    """
+    if seat is None:
+        return frozenset([PASSED_OUT])
+    return frozenset(f"{SEAT_LABELS[seat]}: {rule.as_text()}" for rule in matches)
+
+
+def _distinct_rows(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return indices of first rows of a boolean matrix which differ, and counts.
+
+    Rows of up to 64 columns are grouped by integer keys, longer rows are
+    packed into bytes and grouped more slowly.
+    """
+    if matrix.shape[1] <= 64:
+        weights = np.left_shift(1, np.arange(matrix.shape[1], dtype=np.uint64))
+        keys = matrix.astype(np.uint64) @ weights
+    else:
+        keys = np.packbits(matrix, axis=1)
+        keys = np.ascontiguousarray(keys).view(np.dtype((np.void, keys.shape[1])))
+        keys = keys.ravel()
+    _, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    return first, counts
+
+
+class BidStats:
+    """Counts of hands by the set of matching bids.
+
+    Statistics can be merged, saved to and loaded from a JSON file. The
+    ``info`` dictionary is saved along with the counts.
+    """
+
+    def __init__(self):
+        self.counter_ = Counter()
+        self.info: dict[str, Any] = {}
+
+    @property
+    def total(self) -> int:
+        """Return number of recorded hands."""
+        return sum(self.counter_.values())
+
+    def record(self, matches: list[Rule], count: int = 1):
+        key = frozenset(rule.as_text() for rule in matches)
+        self.counter_[key] += count
+
+    def record_matrix(self, rules: list[Rule], matrix: np.ndarray):
+        """Record hands given by rows of an (N, num_rules) match matrix."""
+        first, counts = _distinct_rows(matrix)
+        for row, count in zip(matrix[first].tolist(), counts.tolist()):
+            self.record([rule for rule, hit in zip(rules, row) if hit], count)
+
+    def record_opening(
+        self, seat: int | None, matches: Iterable[Rule], count: int = 1
+    ):
+        """Record a deal opened in a seat counted from the dealer, or passed out."""
+        self.counter_[opening_bids(seat, matches)] += count
+
+    def record_deal(self, deal: Deal, match: Callable[[Hand], Iterable[Rule]]):
+        """Record the first seat from the dealer with a matching bid."""
+        for seat, (_, hand) in enumerate(deal.hands_from_dealer()):
+            matches = list(match(hand))
+            if matches:
+                self.record_opening(seat, matches)
+                return
+        self.record_opening(None, [])
+
+    def record_openings(
+        self, rules: list[Rule], seats: np.ndarray, matrix: np.ndarray
+    ):
+        """Record deals given by opening seats and matches of ``opening_matrix``."""
+        num_seats = len(SEAT_LABELS)
+        seats = np.asarray(seats)
+        seat_columns = seats[:, None] == np.arange(num_seats + 1)
+        first, counts = _distinct_rows(np.column_stack([seat_columns, matrix]))
+        rows = zip(seats[first].tolist(), matrix[first].tolist(), counts.tolist())
+        for seat, row, count in rows:
+            matches = [rule for rule, hit in zip(rules, row) if hit]
+            self.record_opening(None if seat == num_seats else seat, matches, count)
+
+    def seat_counts(self) -> Counter[str]:
+        """Return numbers of deals by the opening seat, or passed out."""
+        result = Counter()
+        for bids, count in self.counter_.items():
+            labels = {bid.partition(":")[0] for bid in bids}
+            for label in labels:
+                result[label] += count
+        return result
+
+    def confidence_interval(
+        self, bids: frozenset[str], z: float = 1.96
+    ) -> tuple[float, float]:
+        """Return Wilson score interval of the fraction of hands with the bids.
+
+        The default ``z`` gives a 95% confidence interval.
+        """
+        total = self.total
+        if total == 0:
+            return 0.0, 1.0
+        fraction = self.counter_[bids] / total
+        scale = 1 + z * z / total
+        center = (fraction + z * z / (2 * total)) / scale
+        spread = z * math.sqrt(
+            fraction * (1 - fraction) / total + z * z / (4 * total * total)
+        )
+        return max(0.0, center - spread / scale), min(1.0, center + spread / scale)
+
+    def converged(self, tolerance: float, z: float = 1.96) -> bool:
+        """Check whether every recorded interval is narrower than tolerance."""
+        if self.total == 0:
+            return False
+        for bids in self.counter_:
+            low, high = self.confidence_interval(bids, z)
+            if high - low >= tolerance:
+                return False
+        return True
+
+    def merge(self, other: BidStats):
+        """Add counts recorded by other statistics."""
+        self.counter_.update(other.counter_)
+
+    def save(self, path: str | os.PathLike):
+        """Save statistics to a file, replacing it atomically."""
+        data = {
+            "format": FORMAT,
+            "version": VERSION,
+            "info": self.info,
+            "counts": [
+                [sorted(bids), count] for bids, count in self.counter_.items()
+            ],
+        }
+        temp_path = f"{os.fspath(path)}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls: type[BidStats], path: str | os.PathLike) -> BidStats:
+        """Load statistics saved to a file."""
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("format") != FORMAT or data.get("version") != VERSION:
+            msg = f"{os.fspath(path)!r} is not a saved BidStats file"
+            raise ValueError(msg)
+        stats = cls()
+        stats.info = data["info"]
+        for bids, count in data["counts"]:
+            stats.counter_[frozenset(bids)] += count
+        return stats
+
+    def print(self, num_deals: int, z: float | None = None):
+        """Print the table of bids, with confidence intervals if z is given."""
+        table = PrettyTable()
+        table.field_names = ["Matching bid(s)", "Count", "Percentage"]
+        if z is not None:
+            table.field_names += ["Interval"]
+            table.align["Interval"] = 'r'
+        table.align["Matching bid(s)"] = 'l'
+        table.align["Count"] = 'r'
+        table.align["Percentage"] = 'r'
+        for bids, count in self.counter_.items():
+            text = " or ".join(sorted(bids)) or "no bid matches"
+            row = [text, count, f"{100 * count / num_deals:.2f}"]
+            if z is not None:
+                low, high = self.confidence_interval(bids, z)
+                row.append(f"{100 * low:.2f}-{100 * high:.2f}")
+            table.add_row(row)
+        print(table.get_string(sortby="Count", reversesort=True))
@@ -0,0 +1,109 @@
+"""Compact binary storage of full deals.
+
+A deal file starts with an 8-byte header followed by 13 bytes per deal. Each
+byte holds the seats (0 to 3) of four consecutive cards of ALL_CARDS, two
+bits per card, starting from the lowest bits.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Iterator
+
+import numpy as np
+
+from bridge.batch import NUM_SEATS, deal
+from bridge.cards import ALL_CARDS
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+HEADER = b"3BDEAL\x00\x01"
+DEAL_SIZE = len(ALL_CARDS) // NUM_SEATS
+
+_SHIFTS = np.arange(0, 8, 2, dtype=np.uint8)
+
+
+def pack(deals: np.ndarray) -> np.ndarray:
+    """Pack a (K, 52) array of card seats into a (K, 13) array of bytes."""
+    quads = deals.astype(np.uint8).reshape(len(deals), DEAL_SIZE, NUM_SEATS)
+    return np.bitwise_or.reduce(quads << _SHIFTS, axis=2)
+
+
+def unpack(packed: np.ndarray) -> np.ndarray:
+    """Unpack a (K, 13) array of bytes into a (K, 52) array of card seats."""
+    quads = (packed[..., np.newaxis] >> _SHIFTS) & 0b11
+    return quads.reshape(*packed.shape[:-1], len(ALL_CARDS))
+
+
+class DealWriter:
+    """Writer of deals to a new deal file."""
+
+    def __init__(self, path: str | os.PathLike):
+        self._file = open(path, "wb")  # noqa: SIM115
+        self._file.write(HEADER)
+
+    def __enter__(self) -> DealWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write(self, deals: np.ndarray) -> None:
+        """Write a (K, 52) array of card seats, as made by ``batch.deal``."""
+        self._file.write(pack(deals).tobytes())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def write_deals(
+    path: str | os.PathLike,
+    num_deals: int,
+    rng: np.random.Generator,
+    batch_size: int = 100_000,
+) -> None:
+    """Deal random deals into a new deal file."""
+    with DealWriter(path) as writer:
+        for start in range(0, num_deals, batch_size):
+            writer.write(deal(min(batch_size, num_deals - start), rng))
+
+
+class DealFile:
+    """Memory-mapped deal file with random access to deals.
+
+    Indexing returns card seats of one deal, or of many deals for slices and
+    index arrays, unpacked as by ``unpack``.
+    """
+
+    raw: np.ndarray
+    """Zero-copy (K, 13) view of packed deals."""
+
+    def __init__(self, path: str | os.PathLike):
+        size = os.path.getsize(path)
+        with open(path, "rb") as file:
+            header = file.read(len(HEADER))
+        if header != HEADER or (size - len(HEADER)) % DEAL_SIZE:
+            msg = f"{os.fspath(path)!r} is not a deal file"
+            raise ValueError(msg)
+        if size == len(HEADER):
+            self.raw = np.empty((0, DEAL_SIZE), dtype=np.uint8)
+        else:
+            data = np.memmap(path, dtype=np.uint8, mode="r", offset=len(HEADER))
+            self.raw = data.reshape(-1, DEAL_SIZE)
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __getitem__(self, index) -> np.ndarray:
+        return unpack(np.asarray(self.raw[index]))
+
+    def batches(self, batch_size: int = 100_000) -> Iterator[np.ndarray]:
+        """Iterate over unpacked deals sequentially, in arrays of batch_size."""
+        for start in range(0, len(self), batch_size):
+            yield self[start : start + batch_size]
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+from time import perf_counter
+from typing import Any, Callable, NamedTuple
+
+import numpy as np
+from bridge.batch import cards_array, deal, features, match_matrix
+from bridge.bidding import all_openings, open_1_notrump
+from bridge.cards import ALL_CARDS, CompactHand, Hand, Suit
+from bridge.compiler import compile_rules
+from bridge.conditions import cards_range, points_range
+from bridge.dealer import deal_hands
+from bridge.lookup import RuleTable
+from bridge.stats import BidStats
+from prettytable import PrettyTable
+
+
+class Benchmark(NamedTuple):
+    name: str
+    prepare: Callable[[], Any]
+    run: Callable[[Any], None]
+
+
+def random_hand_texts(num_hands: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    deck = list(ALL_CARDS)
+    texts = []
+    for _ in range(num_hands):
+        rng.shuffle(deck)
+        texts.append(Hand(deck[:13]).as_text())
+    return texts
+
+
+def benchmarks(num_hands: int, seed: int) -> list[Benchmark]:
+    """Return benchmarks, each processing ``num_hands`` hands per run.
+
+    Hands are created anew by ``prepare`` so that cached profiles do not
+    carry over between runs.
+    """
+    texts = random_hand_texts(num_hands, seed)
+    points = points_range(12, 17)
+    hearts = cards_range(3, 5, Suit.HEART)
+    rule = open_1_notrump
+    compiled = compile_rules(all_openings)
+    table = RuleTable(all_openings)
+    table.build()
+
+    def hands():
+        return [Hand.from_text(text) for text in texts]
+
+    def compact_hands():
+        return [CompactHand.from_hand(hand) for hand in hands()]
+
+    def nothing():
+        return None
+
+    def consume(iterable):
+        for _ in iterable:
+            pass
+
+    result = [
+        Benchmark(
+            "Hand.from_text", nothing, lambda _: consume(map(Hand.from_text, texts))
+        ),
+        Benchmark(
+            "CompactHand.from_text",
+            nothing,
+            lambda _: consume(map(CompactHand.from_text, texts)),
+        ),
+        Benchmark("Hand.points", hands, lambda hs: consume(h.points() for h in hs)),
+        Benchmark(
+            "CompactHand.points",
+            compact_hands,
+            lambda hs: consume(h.points() for h in hs),
+        ),
+        Benchmark(
+            "Condition.evaluate points",
+            hands,
+            lambda hs: consume(points.evaluate(h) for h in hs),
+        ),
+        Benchmark(
+            "Condition.evaluate cards",
+            hands,
+            lambda hs: consume(hearts.evaluate(h) for h in hs),
+        ),
+        Benchmark(
+            "Condition.evaluate cards (CompactHand)",
+            compact_hands,
+            lambda hs: consume(hearts.evaluate(h) for h in hs),
+        ),
+        Benchmark(
+            "Rule.match", hands, lambda hs: consume(rule.match(h) for h in hs)
+        ),
+        Benchmark(
+            "matching openings (interpreter)",
+            hands,
+            lambda hs: consume([r for r in all_openings if r.match(h)] for h in hs),
+        ),
+        Benchmark(
+            "matching openings (compiled)",
+            hands,
+            lambda hs: consume(map(compiled, hs)),
+        ),
+        Benchmark(
+            "matching openings (table)",
+            hands,
+            lambda hs: consume(map(table.match, hs)),
+        ),
+        Benchmark(
+            "matching openings (batch)",
+            lambda: features(cards_array(hands())),
+            lambda fs: match_matrix(all_openings, fs),
+        ),
+    ]
+
+    def deal_and_record(_):
+        stats = BidStats()
+        for hand in deal_hands(num_hands, 0, random.Random(seed)):
+            stats.record(table.match(hand))
+
+    def deal_and_record_batch(_):
+        stats = BidStats()
+        deals = deal(num_hands // 4, np.random.default_rng(seed))
+        for seat in range(4):
+            hands = features(deals == seat)
+            stats.record_matrix(all_openings, match_matrix(all_openings, hands))
+
+    result += [
+        Benchmark("dealer + BidStats", nothing, deal_and_record),
+        Benchmark("dealer + BidStats (batch)", nothing, deal_and_record_batch),
+    ]
+    return result
+
+
+def measure(benchmark: Benchmark, num_hands: int, repeat: int) -> float:
+    """Return the best number of hands per second over repeated runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        data = benchmark.prepare()
+        start = perf_counter()
+        benchmark.run(data)
+        best = min(best, perf_counter() - start)
+    return num_hands / best
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmarks of hot paths.")
+    parser.add_argument("--hands", type=int, default=10_000, help="hands per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark")
+    parser.add_argument("--seed", type=int, default=1, help="seed of random hands")
+    parser.add_argument("--only", help="run benchmarks with names containing ONLY")
+    parser.add_argument("--output", metavar="FILE", help="save results as JSON")
+    parser.add_argument(
+        "--baseline", metavar="FILE", help="compare with results saved to FILE"
+    )
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+
+    table = PrettyTable()
+    table.field_names = ["Benchmark", "Hands/s", "Baseline ratio"]
+    table.align["Benchmark"] = 'l'
+    table.align["Hands/s"] = 'r'
+    table.align["Baseline ratio"] = 'r'
+    results = {}
+    for benchmark in benchmarks(args.hands, args.seed):
+        if args.only and args.only not in benchmark.name:
+            continue
+        speed = measure(benchmark, args.hands, args.repeat)
+        results[benchmark.name] = speed
+        ratio = (
+            f"{speed / baseline[benchmark.name]:.2f}"
+            if benchmark.name in baseline
+            else "-"
+        )
+        table.add_row([benchmark.name, f"{speed:,.0f}", ratio])
+    print(table)
+
+    if args.output:
+        data = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "hands": args.hands,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import argparse
+
+from bridge.bidding import all_openings
+from bridge.coverage import hands_total, regions, shape_text
+from prettytable import PrettyTable
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Gaps and overlaps of opening bids over all possible hands."
+    )
+    parser.add_argument("min_points", type=int, nargs='?', default=12)
+    parser.add_argument(
+        "--limit", type=int, default=50, help="print at most LIMIT regions"
+    )
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    found = regions(all_openings, args.min_points)
+    total = hands_total(args.min_points)
+    gaps = sum(region.count for region in found if not region.rules) / total
+    overlaps = sum(region.count for region in found if region.rules) / total
+    print(f"Hands with PC >= {args.min_points} matching no bid: {100 * gaps:.4f}%")
+    print(
+        f"Hands with PC >= {args.min_points} matching many bids: {100 * overlaps:.4f}%"
+    )
+
+    table = PrettyTable()
+    table.field_names = ["Matching bid(s)", "Shape", "Points", "Percentage"]
+    table.title = f"Percentages of hands with PC >= {args.min_points}"
+    table.align["Matching bid(s)"] = 'l'
+    table.align["Percentage"] = 'r'
+    for region in found[: args.limit]:
+        bids = [all_openings[index].as_text() for index in region.rules]
+        points = (
+            f"{region.min_points}"
+            if region.min_points == region.max_points
+            else f"{region.min_points}-{region.max_points}"
+        )
+        table.add_row(
+            [
+                " or ".join(bids) or "no bid matches",
+                shape_text(region.shape),
+                points,
+                f"{100 * region.count / total:.4f}",
+            ]
+        )
+    print(table)
+    if len(found) > args.limit:
+        print(f"{len(found) - args.limit} more regions not shown.")
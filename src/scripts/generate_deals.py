@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+from bridge.storage import write_deals
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Deal random deals into a file.")
+    parser.add_argument("num_deals", type=int)
+    parser.add_argument("path", metavar="FILE")
+    parser.add_argument("--seed", type=int, help="seed of the random generator")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    print(f"Dealing {args.num_deals} deals into {args.path}.")
+    write_deals(args.path, args.num_deals, np.random.default_rng(args.seed))
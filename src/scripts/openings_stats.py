@@ -1,63 +1,166 @@
 from __future__ import annotations
 
-import random
-import sys
-from collections import Counter
-from typing import TYPE_CHECKING, Iterable
+import argparse
 
-from bridge.bidding import all_openings
-from bridge.cards import ALL_CARDS, Hand
-from prettytable import PrettyTable
+from bridge.simulation import (
+    CHUNK_HANDS,
+    deal_file_stats,
+    exact_stats,
+    pbn_stats,
+    profiled_stats,
+    simulate,
+)
+from bridge.stats import BidStats
 
-if TYPE_CHECKING:
-    from collections.abc import Generator
 
-    from bridge.rules import Rule
+def parse_shard(text: str) -> tuple[int, int]:
+    index, _, count = text.partition("/")
+    shard = (int(index), int(count))
+    if not 0 <= shard[0] < shard[1]:
+        msg = f"invalid shard {text!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return shard
 
 
-def dealer(num_hands, min_points) -> Generator[Hand]:
-    num_dealt = 0
-    deck = list(ALL_CARDS)
-    while num_dealt < num_hands:
-        random.shuffle(deck)
-        hand = Hand(deck[0:13])
-        if hand.points() >= min_points:
-            num_dealt += 1
-            yield hand
-
-
-def matching_openings(hand: Hand) -> Iterable[Rule]:
-    return filter(lambda rule: rule.match(hand), all_openings)
-
-
-class BidStats:
-    def __init__(self):
-        self.counter_ = Counter()
-
-    def record(self, matches: list[Rule]):
-        key = frozenset(rule.as_text() for rule in matches)
-        self.counter_.update([key])
-
-    def print(self, num_deals: int):
-        table = PrettyTable()
-        table.field_names = ["Matching bid(s)", "Count", "Percentage"]
-        table.align["Matching bid(s)"] = 'l'
-        table.align["Count"] = 'r'
-        table.align["Percentage"] = 'r'
-        for bids, count in self.counter_.items():
-            text = " or ".join(sorted(bids)) or "no bid matches"
-            table.add_row([text, count, f"{100*count/num_deals:.2f}"])
-        print(table.get_string(sortby="Count", reversesort=True))
+def parse_args():
+    parser = argparse.ArgumentParser(description="Statistics of opening bids.")
+    parser.add_argument("total_hands", type=int, nargs='?', default=1000)
+    parser.add_argument("min_points", type=int, nargs='?', default=12)
+    parser.add_argument(
+        "--exact",
+        action="store_true",
+        help="count all possible hands instead of dealing random ones",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="deal and evaluate hands in NumPy arrays",
+    )
+    parser.add_argument("--seed", type=int, help="seed of the random generator")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes dealing hands in parallel",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=(0, 1),
+        metavar="INDEX/COUNT",
+        help="deal only one of COUNT disjoint parts of the hands",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        metavar="FILE",
+        help="save statistics to FILE periodically and resume from it",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=10,
+        metavar="CHUNKS",
+        help=f"save checkpoint every CHUNKS chunks of {CHUNK_HANDS} hands",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        metavar="PERCENT",
+        help="stop once every 95%% confidence interval is narrower than PERCENT",
+    )
+    parser.add_argument(
+        "--seats",
+        action="store_true",
+        help="deal TOTAL_HANDS deals and record the first seat opening each",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="match rules one by one and report time spent in every rule",
+    )
+    parser.add_argument(
+        "--pbn",
+        metavar="FILE",
+        help="classify hands of deals in a PBN file instead of dealing",
+    )
+    parser.add_argument(
+        "--deals",
+        metavar="FILE",
+        help="classify hands of deals in a deal file instead of dealing",
+    )
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        metavar="FILE",
+        help="print merged statistics saved to files instead of dealing",
+    )
+    args = parser.parse_args()
+    if args.checkpoint and args.seed is None:
+        parser.error("--checkpoint requires --seed to resume reproducibly")
+    if args.seats:
+        for option in ("exact", "profile", "merge", "deals"):
+            if getattr(args, option):
+                parser.error(f"--seats cannot be used with --{option}")
+    return args
 
 
 if __name__ == '__main__':
-    args = sys.argv[1:]
-    total_hands = int(args[0]) if len(args) > 0 else 1000
-    min_points = int(args[1]) if len(args) > 1 else 12
-    print(f"Generating {total_hands} hands, each with PC >= {min_points}.")
-    stats = BidStats()
-    for hand in dealer(total_hands, min_points):
-        matches = list(matching_openings(hand))
-        stats.record(matches)
-    print("Bid distribution:")
-    stats.print(total_hands)
+    args = parse_args()
+    if args.merge:
+        print(f"Merging statistics from {len(args.merge)} file(s).")
+        stats = BidStats()
+        for path in args.merge:
+            stats.merge(BidStats.load(path))
+        total_hands = stats.total
+    elif args.pbn and args.seats:
+        print(f"Reading deals from {args.pbn}.")
+        stats = pbn_stats(args.pbn, args.min_points, seats=True)
+        total_hands = stats.total
+    elif args.pbn:
+        print(f"Reading hands with PC >= {args.min_points} from {args.pbn}.")
+        stats = pbn_stats(args.pbn, args.min_points)
+        total_hands = stats.total
+    elif args.deals:
+        print(f"Reading hands with PC >= {args.min_points} from {args.deals}.")
+        stats = deal_file_stats(args.deals, args.min_points)
+        total_hands = stats.total
+    elif args.exact:
+        print(f"Counting all hands with PC >= {args.min_points}.")
+        stats, total_hands = exact_stats(args.min_points)
+    elif args.profile:
+        total_hands = args.total_hands
+        print(f"Profiling {total_hands} hands, each with PC >= {args.min_points}.")
+        stats, profiler = profiled_stats(total_hands, args.min_points, args.seed)
+        print("Rule matching profile:")
+        profiler.print()
+    else:
+        total_hands = args.total_hands
+        min_points = args.min_points
+        limit = "up to " if args.tolerance else ""
+        if args.seats:
+            print(f"Generating {limit}{total_hands} deals.")
+        else:
+            print(
+                f"Generating {limit}{total_hands} hands, each with PC >= {min_points}."
+            )
+        stats = simulate(
+            total_hands,
+            min_points,
+            seed=args.seed,
+            jobs=args.jobs,
+            batch=args.batch,
+            shard=args.shard,
+            checkpoint=args.checkpoint,
+            checkpoint_every=args.checkpoint_every,
+            tolerance=args.tolerance and args.tolerance / 100,
+            seats=args.seats,
+        )
+        total_hands = stats.total
+    if args.seats:
+        print(f"Opening seats of {total_hands} deals:")
+        for label, count in sorted(stats.seat_counts().items()):
+            print(f"  {label}: {count} ({100 * count / total_hands:.2f}%)")
+        print(f"Bid distribution of {total_hands} deals:")
+    else:
+        print(f"Bid distribution of {total_hands} hands:")
+    stats.print(total_hands, z=1.96 if args.tolerance else None)
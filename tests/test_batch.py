@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from bridge.batch import (
+    POINTS_FEATURE,
+    cards_array,
+    deal,
+    features,
+    length_feature,
+    match_matrix,
+    opening_matrix,
+)
+from bridge.bid import Bid, Trump
+from bridge.bidding import all_openings
+from bridge.cards import ALL_CARDS, Hand, Suit
+from bridge.conditions import Condition, Variable
+from bridge.deal import Deal
+from bridge.rules import Rule
+from hypothesis import given
+
+hands = st.permutations(ALL_CARDS).map(lambda cards: Hand(cards[:13]))
+
+
+def test_cards_array_has_columns_ordered_as_all_cards():
+    hand = Hand.from_text("A...2")
+    row = cards_array([hand])[0]
+    assert [card for card, held in zip(ALL_CARDS, row) if held] == sorted(
+        hand, key=ALL_CARDS.index
+    )
+
+
+def test_features_have_points_and_suit_lengths():
+    hand = Hand.from_text("AKQ.J10.98765.AKQ")
+    row = features(cards_array([hand]))[0]
+    assert row[POINTS_FEATURE] == 19
+    assert [row[length_feature(suit)] for suit in Suit] == [3, 5, 2, 3]
+
+
+@given(hands=st.lists(hands, min_size=1, max_size=20))
+def test_match_matrix_of_openings_is_same_as_interpreter(hands):
+    matrix = match_matrix(all_openings, features(cards_array(hands)))
+    expected = [[rule.match(hand) for rule in all_openings] for hand in hands]
+    assert matrix.tolist() == expected
+
+
+def test_match_matrix_of_no_hands_is_empty():
+    matrix = match_matrix(all_openings, features(cards_array([])))
+    assert matrix.shape == (0, len(all_openings))
+    assert matrix.dtype == np.bool_
+
+
+def test_match_matrix_with_unknown_condition_throws():
+    rule = Rule(Bid(1, Trump.CLUB), require=[Condition(Variable.CARDS)])
+    with pytest.raises(NotImplementedError):
+        match_matrix([rule], features(cards_array([Hand()])))
+
+
+def test_dealt_deals_give_13_cards_to_every_seat():
+    deals = deal(100, np.random.default_rng(1))
+    assert deals.shape == (100, 52)
+    for seat in range(4):
+        assert ((deals == seat).sum(axis=1) == 13).all()
+
+
+def test_dealing_with_same_seed_gives_same_deals():
+    first = deal(10, np.random.default_rng(7))
+    second = deal(10, np.random.default_rng(7))
+    assert (first == second).all()
+    assert (first != deal(10, np.random.default_rng(8))).any()
+
+
+def test_dealt_cards_are_spread_evenly_between_seats():
+    deals = deal(4000, np.random.default_rng(3))
+    share = (deals == 0).mean(axis=0)
+    assert np.allclose(share, 0.25, atol=0.04)
+
+
+def test_opening_matrix_finds_first_seat_from_dealer_with_a_bid():
+    deals = deal(200, np.random.default_rng(5))
+    seats, matrix = opening_matrix(all_openings, deals)
+    for row, seat, matches in zip(deals, seats, matrix):
+        full = Deal.from_seats(row)
+        opened = [
+            [r.match(hand) for r in all_openings]
+            for _, hand in full.hands_from_dealer()
+        ]
+        expected = next((i for i, m in enumerate(opened) if any(m)), 4)
+        assert seat == expected
+        assert list(matches) == (
+            opened[seat] if seat < 4 else [False] * len(matches)
+        )
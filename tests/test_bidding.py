@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from bridge.bidding import (
     open_1_clubs_balanced,
@@ -115,3 +117,9 @@ from bridge.cards import Hand
 def test_opening_1_examples_should_match_hand_as_expected(rule, hand_text, expected):
     hand = Hand.from_text(hand_text)
     assert rule.match(hand) is expected
+
+
+def test_bids_are_slotted_and_survive_pickling():
+    bid = open_2_clubs.bid
+    assert not hasattr(bid, '__dict__')
+    assert pickle.loads(pickle.dumps(bid)) == bid
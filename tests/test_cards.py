@@ -1,5 +1,20 @@
+import pickle
+from dataclasses import FrozenInstanceError
+
 import pytest
-from bridge.cards import Card, Hand, Rank, Suit
+from bridge.cards import (
+    ALL_CARDS,
+    Card,
+    CompactHand,
+    Hand,
+    HandProfile,
+    Rank,
+    Suit,
+    holding_controls,
+    holding_losers,
+    holding_quality,
+    holding_quick_tricks,
+)
 
 
 def test_length_of_empty_hand_is_0():
@@ -182,3 +197,142 @@ def test_creating_hand_from_text_with_invalid_card_ranks_throw(hand_text):
 def test_creating_hand_form_text_with_invalid_number_of_suits_throw(hand_text):
     with pytest.raises(ValueError, match=r"expecting exactly 4 suits"):
         Hand.from_text(hand_text)
+
+
+def test_length_of_empty_compact_hand_is_0():
+    hand = CompactHand()
+    assert len(hand) == 0
+
+
+def test_adding_same_card_to_compact_hand_twice_throws():
+    hand = CompactHand()
+    card = Card(Suit.SPADE, Rank.ACE)
+    hand.add(card)
+    assert card in hand
+    with pytest.raises(ValueError, match=r".* already in hand"):
+        hand.add(card)
+
+
+@pytest.mark.parametrize(
+    "hand_text",
+    [
+        "...",
+        "A...",
+        "...2",
+        "AK.QJ.109.876",
+        "A108.A108.A108.A108",
+        "AKQJ1098765432...",
+    ],
+)
+def test_compact_hand_text_to_hand_and_back_gives_same_text(hand_text):
+    hand = CompactHand.from_text(hand_text)
+    assert hand.as_text() == hand_text
+    assert hand.points() == Hand.from_text(hand_text).points()
+
+
+def test_compact_hand_converts_to_hand_and_back_without_loss():
+    hand = Hand(ALL_CARDS[::4])
+    compact = CompactHand.from_hand(hand)
+    assert len(compact) == len(hand)
+    assert set(compact) == set(hand)
+    assert set(compact.to_hand()) == set(hand)
+    assert CompactHand.from_mask(compact.mask).as_text() == hand.as_text()
+
+
+def test_compact_hand_holding_has_rank_bits_of_one_suit():
+    hand = CompactHand.from_text("A.K2..")
+    assert hand.holding(Suit.SPADE) == 1 << Rank.ACE.value
+    assert hand.holding(Suit.HEART) == 1 << Rank.KING.value | 1 << Rank.TWO.value
+    assert hand.holding(Suit.DIAMOND) == 0
+
+
+def test_compact_hand_from_mask_outside_of_deck_throws():
+    with pytest.raises(ValueError, match=r"outside of the deck"):
+        CompactHand.from_mask(1 << 52)
+
+
+def test_hand_profile_has_points_and_suit_lengths():
+    hand = Hand.from_text("AKQ.J10.98765.AKQ")
+    profile = hand.profile()
+    assert profile.points == 19
+    assert profile.lengths == (3, 5, 2, 3)
+    assert profile.length(Suit.DIAMOND) == 5
+
+
+def test_hand_profile_is_recomputed_after_adding_card():
+    hand = Hand.from_text("AKQ.J10.98765.AK")
+    assert hand.profile() is hand.profile()
+    hand.add(Card(Suit.CLUB, Rank.QUEEN))
+    assert hand.profile().points == 19
+    assert hand.profile().length(Suit.CLUB) == 3
+
+
+def test_compact_hand_profile_is_recomputed_after_adding_card():
+    hand = CompactHand.from_text("AKQ.J10.98765.AK")
+    assert hand.profile() == Hand.from_text("AKQ.J10.98765.AK").profile()
+    hand.add(Card(Suit.CLUB, Rank.QUEEN))
+    assert hand.profile().points == 19
+    assert hand.profile().length(Suit.CLUB) == 3
+
+
+def test_cards_are_single_instances_with_id_of_all_cards():
+    card = Card(Suit.HEART, Rank.TEN)
+    assert card is Card.from_text('H10')
+    assert ALL_CARDS[card.id] is card
+    assert Card.from_id(card.id) is card
+    assert [c.id for c in ALL_CARDS] == list(range(52))
+
+
+def test_cards_have_no_instance_dictionary_and_cannot_change():
+    card = Card(Suit.CLUB, Rank.TWO)
+    assert not hasattr(card, '__dict__')
+    with pytest.raises(FrozenInstanceError):
+        card.rank = Rank.ACE
+
+
+def test_pickled_card_is_the_same_instance():
+    card = Card(Suit.SPADE, Rank.QUEEN)
+    assert pickle.loads(pickle.dumps(card)) is card
+
+
+def _holding(text: str) -> int:
+    hand = CompactHand.from_text(f"{text}...")
+    return hand.holding(Suit.SPADE)
+
+
+@pytest.mark.parametrize(
+    ("text", "losers", "controls", "quick_tricks", "quality"),
+    [
+        ("", 0, 0, 0, 0),
+        ("A", 0, 2, 1, 2),
+        ("K", 1, 1, 0, 2),
+        ("Kx", 1, 1, 0.5, 3),
+        ("Q2", 2, 0, 0, 3),
+        ("AK", 0, 3, 2, 4),
+        ("AQ3", 1, 2, 1.5, 5),
+        ("KQ5", 1, 1, 1, 5),
+        ("AKQ2", 0, 3, 2, 7),
+        ("J10987", 3, 0, 0, 7),
+    ],
+)
+def test_holding_metrics(text, losers, controls, quick_tricks, quality):
+    holding = _holding(text.replace("x", "2"))
+    assert holding_losers(holding) == losers
+    assert holding_controls(holding) == controls
+    assert holding_quick_tricks(holding) == quick_tricks
+    assert holding_quality(holding) == quality
+
+
+@pytest.mark.parametrize("hand_type", [Hand, CompactHand])
+def test_profile_sums_holding_metrics(hand_type):
+    profile = hand_type.from_text('AKQ2.KJ3.Q2.K543').profile()
+    assert profile.losers == 6
+    assert profile.controls == 5
+    assert profile.quick_tricks == 3
+    assert profile.qualities == (5, 3, 5, 7)
+
+
+def test_profile_without_holdings_has_no_holding_metrics():
+    profile = HandProfile(points=10, lengths=(4, 3, 3, 3))
+    with pytest.raises(NotImplementedError):
+        profile.losers
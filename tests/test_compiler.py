@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import hypothesis.strategies as st
+import pytest
+from bridge.bid import Bid, Trump
+from bridge.bidding import all_openings
+from bridge.cards import ALL_CARDS, Hand, Suit
+from bridge.compiler import compile_rules, rules_source
+from bridge.conditions import (
+    Condition,
+    Variable,
+    cards_max,
+    controls_min,
+    losers_range,
+    points_min,
+    quick_tricks_min,
+    suit_quality_min,
+)
+from bridge.rules import Rule
+from hypothesis import given
+
+hands = st.permutations(ALL_CARDS).map(lambda cards: Hand(cards[:13]))
+
+
+@given(hand=hands)
+def test_compiled_openings_match_same_rules_as_interpreter(hand):
+    match = compile_rules(all_openings)
+    assert match(hand) == [rule for rule in all_openings if rule.match(hand)]
+
+
+@given(hand=hands)
+def test_compiled_rules_without_limits_match_same_rules_as_interpreter(hand):
+    rules = [
+        Rule(Bid(1, Trump.CLUB)),
+        Rule(Bid(1, Trump.DIAMOND), exclude=[points_min(10)]),
+        Rule(Bid(1, Trump.HEART), require=[Condition(Variable.POINTS)]),
+        Rule(Bid(1, Trump.SPADE), require=[cards_max(3, Suit.SPADE)]),
+    ]
+    match = compile_rules(rules)
+    assert match(hand) == [rule for rule in rules if rule.match(hand)]
+
+
+@given(hand=hands)
+def test_compiled_holding_metrics_match_same_rules_as_interpreter(hand):
+    rules = [
+        Rule(Bid(1, Trump.CLUB), require=[losers_range(5, 7)]),
+        Rule(Bid(1, Trump.DIAMOND), require=[controls_min(3)]),
+        Rule(Bid(1, Trump.HEART), exclude=[quick_tricks_min(1.5)]),
+        Rule(Bid(1, Trump.SPADE), require=[suit_quality_min(6, Suit.SPADE)]),
+    ]
+    match = compile_rules(rules)
+    assert match(hand) == [rule for rule in rules if rule.match(hand)]
+
+
+def test_compiled_rules_source_has_one_test_per_rule():
+    source = rules_source(all_openings)
+    assert source.count("matches.append") == len(all_openings)
+
+
+def test_compiling_rule_with_unknown_condition_throws():
+    rule = Rule(Bid(1, Trump.CLUB), require=[Condition(Variable.CARDS)])
+    with pytest.raises(NotImplementedError):
+        compile_rules([rule])
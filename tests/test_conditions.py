@@ -11,10 +11,16 @@ from bridge.conditions import (
     cards_max,
     cards_min,
     cards_range,
+    controls_min,
+    controls_range,
+    losers_max,
+    losers_range,
     points,
     points_max,
     points_min,
     points_range,
+    quick_tricks_min,
+    suit_quality_min,
 )
 from hypothesis import given
 
@@ -149,3 +155,29 @@ def test_one_suit_card_conditions_evaluate_correctly(hand, suit):
         cards_range(4, 6, suit),
         lambda hand: 4 <= sum(card.suit == suit for card in hand) <= 6,
     )
+
+
+@pytest.mark.parametrize(
+    ("condition", "text"),
+    [
+        (losers_max(7), "do 7 przegrywających"),
+        (losers_range(5, 7), "od 5 do 7 przegrywających"),
+        (controls_min(4), "od 4 kontroli"),
+        (controls_range(3, 3), "3 kontroli"),
+        (quick_tricks_min(1.5), "od 1.5 szybkich lew"),
+        (suit_quality_min(9, Suit.HEART), "od 9 jakości kierów"),
+    ],
+)
+def test_description_of_holding_metrics(condition, text):
+    assert condition.describe() == text
+
+
+def test_holding_metric_conditions_evaluate_hand():
+    hand = Hand.from_text('AKQ2.KJ3.Q2.K543')
+    assert losers_range(6, 6).evaluate(hand)
+    assert not losers_max(5).evaluate(hand)
+    assert controls_range(5, 5).evaluate(hand)
+    assert quick_tricks_min(3).evaluate(hand)
+    assert not quick_tricks_min(3.5).evaluate(hand)
+    assert suit_quality_min(7, Suit.SPADE).evaluate(hand)
+    assert not suit_quality_min(6, Suit.HEART).evaluate(hand)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+from bridge.bid import Bid, Trump
+from bridge.bidding import all_openings
+from bridge.cards import Suit
+from bridge.conditions import Condition, Variable, cards_min, points_range
+from bridge.coverage import TOTAL_HANDS, hands_total, regions, shape_text
+from bridge.distribution import match_counts
+from bridge.lookup import RuleTable
+from bridge.rules import Rule
+
+
+def test_shape_text_lists_lengths_from_spades():
+    assert shape_text((1, 3, 4, 5)) == "5-4-3-1"
+
+
+def test_regions_cover_all_hands():
+    rules = [Rule(Bid(1, Trump.CLUB), require=[points_range(12, 21)])]
+    found = regions(rules, problems_only=False)
+    assert sum(region.count for region in found) == TOTAL_HANDS
+    assert sum(region.probability for region in found) == pytest.approx(1)
+
+
+def test_regions_merge_points_of_a_shape():
+    rules = [Rule(Bid(1, Trump.CLUB), require=[points_range(12, 21)])]
+    found = regions(rules, min_points=12)
+    flat = [r for r in found if r.shape == (3, 3, 3, 4)]
+    assert [(r.rules, r.min_points, r.max_points) for r in flat] == [((), 22, 37)]
+
+
+def test_regions_find_overlaps():
+    hearts = Rule(Bid(1, Trump.HEART), require=[cards_min(5, Suit.HEART)])
+    spades = Rule(Bid(1, Trump.SPADE), require=[cards_min(5, Suit.SPADE)])
+    found = regions([hearts, spades])
+    assert {region.rules for region in found} == {(), (0, 1)}
+    overlap = next(r for r in found if r.rules == (0, 1) and r.shape == (0, 0, 6, 7))
+    assert (overlap.min_points, overlap.max_points) == (0, 20)
+
+
+def test_regions_of_openings_agree_with_match_counts():
+    counts = match_counts(RuleTable(all_openings), min_points=12)
+    found = regions(all_openings, min_points=12, problems_only=False)
+    totals = {}
+    for region in found:
+        totals[region.rules] = totals.get(region.rules, 0) + region.count
+    assert totals == dict(counts)
+
+
+def test_hands_total_counts_hands_with_minimum_points():
+    assert hands_total() == TOTAL_HANDS
+    found = regions(all_openings, min_points=12, problems_only=False)
+    assert hands_total(12) == sum(region.count for region in found)
+    assert hands_total(12) < TOTAL_HANDS
+
+
+def test_regions_reject_rules_depending_on_more_than_shape():
+    rule = Rule(Bid(1, Trump.CLUB), require=[Condition(Variable.CARDS, 0, 3)])
+    with pytest.raises(ValueError, match=r"more than points"):
+        regions([rule])
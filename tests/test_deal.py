@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from bridge.batch import deal
+from bridge.cards import Hand
+from bridge.deal import (
+    Deal,
+    Seat,
+    Vulnerability,
+    board_dealer,
+    board_vulnerability,
+)
+
+
+def test_seats_follow_clockwise():
+    assert Seat.NORTH.next() == Seat.EAST
+    assert Seat.WEST.next() == Seat.NORTH
+    assert Seat.SOUTH.next(3) == Seat.EAST
+    assert Seat.EAST.partner == Seat.WEST
+
+
+@pytest.mark.parametrize("text", ["N", "E", "S", "W"])
+def test_seat_text_to_seat_and_back_gives_same_text(text):
+    assert Seat.from_text(text).as_text() == text
+
+
+@pytest.mark.parametrize(
+    ("text", "vulnerable"),
+    [
+        ("None", ""),
+        ("Love", ""),
+        ("NS", "NS"),
+        ("EW", "EW"),
+        ("All", "NESW"),
+        ("Both", "NESW"),
+    ],
+)
+def test_vulnerability_of_seats(text, vulnerable):
+    vulnerability = Vulnerability.from_text(text)
+    assert [s.as_text() for s in Seat if vulnerability.is_vulnerable(s)] == list(
+        vulnerable
+    )
+
+
+@pytest.mark.parametrize(
+    ("board", "dealer", "vulnerability"),
+    [
+        (1, Seat.NORTH, Vulnerability.NONE),
+        (2, Seat.EAST, Vulnerability.NORTH_SOUTH),
+        (4, Seat.WEST, Vulnerability.BOTH),
+        (8, Seat.WEST, Vulnerability.NONE),
+        (9, Seat.NORTH, Vulnerability.EAST_WEST),
+        (16, Seat.WEST, Vulnerability.EAST_WEST),
+        (17, Seat.NORTH, Vulnerability.NONE),
+    ],
+)
+def test_boards_have_standard_dealer_and_vulnerability(board, dealer, vulnerability):
+    assert board_dealer(board) == dealer
+    assert board_vulnerability(board) == vulnerability
+
+
+def test_deal_lists_hands_from_dealer():
+    hands = tuple(Hand.from_text(t) for t in ("A...", "K...", "Q...", "J..."))
+    deal = Deal(hands, dealer=Seat.SOUTH)
+    assert deal.seats_from_dealer() == [Seat.SOUTH, Seat.WEST, Seat.NORTH, Seat.EAST]
+    assert [h.as_text() for _, h in deal.hands_from_dealer()] == [
+        "Q...",
+        "J...",
+        "A...",
+        "K...",
+    ]
+
+
+def test_deal_needs_four_hands():
+    with pytest.raises(ValueError, match=r"expecting exactly 4 hands"):
+        Deal((Hand(), Hand()))
+
+
+def test_deal_from_batch_seats_gives_13_cards_to_every_seat():
+    seats = deal(1, np.random.default_rng(1))[0]
+    full = Deal.from_seats(seats)
+    assert [len(full.hand(seat)) for seat in Seat] == [13] * 4
+    assert sum(full.hand(seat).points() for seat in Seat) == 40
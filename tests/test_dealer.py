@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import random
+from collections import Counter
+
+import pytest
+from bridge.cards import Suit
+from bridge.deal import Seat, Vulnerability
+from bridge.dealer import deal_deals, deal_full, deal_hand, deal_hands
+from bridge.distribution import hand_counts
+
+
+def chi_square(observed: Counter, expected: dict, total: int) -> float:
+    """Return chi-square statistic of observed counts against probabilities."""
+    return sum(
+        (observed[key] - total * p) ** 2 / (total * p) for key, p in expected.items()
+    )
+
+
+def exact_probabilities(min_points: int, key) -> dict:
+    counts = Counter()
+    for points, shape, count in hand_counts(min_points):
+        counts[key(points, shape)] += count
+    total = sum(counts.values())
+    return {k: count / total for k, count in counts.items()}
+
+
+def test_dealt_hands_have_13_cards_and_minimum_points():
+    rng = random.Random(1)
+    for hand in deal_hands(200, min_points=15, rng=rng):
+        assert len(hand) == 13
+        assert len(set(hand)) == 13
+        assert hand.points() >= 15
+
+
+def test_dealing_with_same_seed_gives_same_hands():
+    first = [h.as_text() for h in deal_hands(5, 10, random.Random(4))]
+    second = [h.as_text() for h in deal_hands(5, 10, random.Random(4))]
+    assert first == second
+
+
+def test_dealing_hand_with_too_many_points_throws():
+    with pytest.raises(ValueError, match=r"no hand has at least 38 points"):
+        deal_hand(38)
+
+
+@pytest.mark.parametrize("min_points", [0, 20])
+def test_dealt_points_follow_exact_distribution(min_points):
+    rng = random.Random(2)
+    num_hands = 10000
+    expected = exact_probabilities(min_points, lambda points, shape: points)
+    expected = {k: p for k, p in expected.items() if p * num_hands >= 5}
+    observed = Counter(h.points() for h in deal_hands(num_hands, min_points, rng))
+    # 99.9% quantile of chi-square distribution is below 60 for these bins
+    assert chi_square(observed, expected, num_hands) < 60
+
+
+@pytest.mark.parametrize("suit", list(Suit))
+def test_dealt_suit_lengths_follow_exact_distribution(suit):
+    rng = random.Random(3)
+    num_hands = 10000
+    expected = exact_probabilities(20, lambda points, shape: shape[suit.value])
+    expected = {k: p for k, p in expected.items() if p * num_hands >= 5}
+    observed = Counter(
+        h.profile().length(suit) for h in deal_hands(num_hands, 20, rng)
+    )
+    # 99.9% quantile of chi-square distribution is below 30 for these bins
+    assert chi_square(observed, expected, num_hands) < 30
+
+
+def test_dealt_deal_gives_all_cards_to_four_hands():
+    deal = deal_full(random.Random(6), board=3)
+    assert [len(deal.hand(seat)) for seat in Seat] == [13] * 4
+    assert len(set().union(*(set(hand) for hand in deal.hands))) == 52
+    assert deal.dealer == Seat.SOUTH
+    assert deal.vulnerability == Vulnerability.EAST_WEST
+
+
+def test_dealt_deals_are_consecutive_boards():
+    deals = list(deal_deals(5, random.Random(7)))
+    assert [deal.dealer for deal in deals] == [
+        Seat.NORTH,
+        Seat.EAST,
+        Seat.SOUTH,
+        Seat.WEST,
+        Seat.NORTH,
+    ]
+
+
+def test_hands_without_minimum_points_come_four_from_each_deal():
+    hands = list(deal_hands(6, rng=random.Random(8)))
+    first_deal = deal_full(random.Random(8))
+    assert [h.as_text() for h in hands[:4]] == [
+        h.as_text() for h in first_deal.hands
+    ]
+    assert len(hands) == 6
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from math import comb
+
+import pytest
+from bridge.bid import Bid, Trump
+from bridge.bidding import all_openings, open_2_clubs
+from bridge.conditions import Condition, Variable
+from bridge.distribution import (
+    hand_counts,
+    holding_counts,
+    match_counts,
+    shape_points_counts,
+)
+from bridge.lookup import RuleTable
+from bridge.rules import Rule
+
+
+def test_holding_counts_cover_all_holdings_of_a_suit():
+    counts = holding_counts()
+    assert sum(map(sum, counts)) == 1 << 13
+    assert [sum(row) for row in counts] == [comb(13, n) for n in range(14)]
+    assert counts[1][4] == 1
+    assert counts[4][10] == 1
+
+
+def test_hand_counts_cover_all_hands():
+    assert sum(count for _, _, count in hand_counts()) == comb(52, 13)
+
+
+def test_hands_with_all_cards_of_one_suit_have_10_points():
+    counts = shape_points_counts((0, 0, 0, 13))
+    assert counts[10] == sum(counts) == 1
+
+
+def test_hand_counts_respect_minimum_points():
+    counts = sorted(hand_counts(min_points=37))
+    assert counts == [
+        (37, (3, 3, 3, 4), 1),
+        (37, (3, 3, 4, 3), 1),
+        (37, (3, 4, 3, 3), 1),
+        (37, (4, 3, 3, 3), 1),
+    ]
+
+
+def test_match_counts_cover_all_hands_with_minimum_points():
+    counts = match_counts(RuleTable(all_openings), min_points=12)
+    total = sum(count for _, _, count in hand_counts(min_points=12))
+    assert sum(counts.values()) == total
+
+
+def test_match_counts_give_exact_frequency_of_strong_opening():
+    counts = match_counts(RuleTable([open_2_clubs]))
+    expected = sum(count for points, _, count in hand_counts() if points >= 23)
+    assert counts == {(0,): expected, (): comb(52, 13) - expected}
+
+
+def test_match_counts_of_rules_depending_on_more_than_shape_throws():
+    rule = Rule(Bid(1, Trump.CLUB), require=[Condition(Variable.CARDS)])
+    with pytest.raises(ValueError, match=r"depend on more than"):
+        match_counts(RuleTable([rule]))
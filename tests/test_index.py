@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import hypothesis.strategies as st
+from bridge.bid import Bid, Trump
+from bridge.bidding import (
+    all_openings,
+    open_2_clubs,
+    open_3_clubs,
+    open_3_diamonds,
+    open_3_hearts,
+    open_3_spades,
+)
+from bridge.cards import ALL_CARDS, Hand
+from bridge.conditions import points_range
+from bridge.index import RuleIndex
+from bridge.rules import Rule
+from hypothesis import given
+
+hands = st.permutations(ALL_CARDS).map(lambda cards: Hand(cards[:13]))
+
+
+@given(hand=hands)
+def test_index_matches_same_openings_as_interpreter(hand):
+    index = RuleIndex(all_openings)
+    assert index.match(hand) == [r for r in all_openings if r.match(hand)]
+
+
+def test_weak_hands_are_matched_only_against_preempts():
+    index = RuleIndex(all_openings)
+    preempts = (open_3_clubs, open_3_diamonds, open_3_hearts, open_3_spades)
+    assert index.candidates(6) == preempts
+    assert index.candidates(5) == ()
+
+
+def test_strong_hands_are_matched_only_against_strong_openings():
+    index = RuleIndex(all_openings)
+    assert index.candidates(30) == (open_2_clubs,)
+
+
+def test_excluded_points_leave_gap_in_index():
+    rule = Rule(
+        Bid(1, Trump.CLUB),
+        require=[points_range(10, 20)],
+        exclude=[points_range(14, 15)],
+    )
+    index = RuleIndex([rule])
+    expected = [*range(10, 14), *range(16, 21)]
+    assert [p for p in range(38) if index.candidates(p)] == expected
+
+
+def test_rules_without_points_conditions_are_always_candidates():
+    rule = Rule(Bid(1, Trump.CLUB))
+    index = RuleIndex([rule])
+    assert all(index.candidates(p) == (rule,) for p in range(38))
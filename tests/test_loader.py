@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+from bridge.batch import cards_array
+from bridge.cards import CompactHand, Hand
+from bridge.loader import load_hand_arrays, load_hands
+
+HAND_TEXTS = ["AKQ.J10.98765.AKQ", "...", "# comment", "", "A108.A108.A108.A108"]
+
+
+def test_loading_hands_skips_blank_and_comment_lines():
+    hands = list(load_hands(io.StringIO("\n".join(HAND_TEXTS))))
+    assert [type(hand) for hand in hands] == [Hand, Hand, Hand]
+    assert [hand.as_text() for hand in hands] == [
+        "AKQ.J10.98765.AKQ",
+        "...",
+        "A108.A108.A108.A108",
+    ]
+
+
+def test_loading_compact_hands():
+    hands = list(load_hands(HAND_TEXTS, compact=True))
+    assert all(isinstance(hand, CompactHand) for hand in hands)
+    assert hands[0].as_text() == "AKQ.J10.98765.AKQ"
+
+
+@pytest.mark.parametrize(
+    ("text", "error"),
+    [
+        ("AA...", r"line 2: .* already in hand"),
+        ("T...", r"line 2: unknown card rank"),
+        ("A.A.A.A.A", r"line 2: expecting exactly 4 suits"),
+    ],
+)
+def test_loading_invalid_hand_throws_with_line_number(text, error):
+    with pytest.raises(ValueError, match=error):
+        list(load_hands(["...", text]))
+
+
+def test_loading_hand_arrays_in_batches():
+    lines = ["AKQ.J10.98765.AKQ", "...", "A108.A108.A108.A108"] * 3
+    arrays = list(load_hand_arrays(lines, batch_size=4))
+    assert [len(array) for array in arrays] == [4, 4, 1]
+    expected = cards_array(Hand.from_text(text) for text in lines)
+    assert (arrays[0] == expected[:4]).all()
+    assert (arrays[2] == expected[8:]).all()
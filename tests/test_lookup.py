@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import hypothesis.strategies as st
+from bridge.bid import Bid, Trump
+from bridge.bidding import all_openings
+from bridge.cards import ALL_CARDS, Card, Hand, Rank, Suit
+from bridge.lookup import MAX_POINTS, RuleTable, all_shapes
+from bridge.rules import Rule
+from hypothesis import given
+
+hands = st.permutations(ALL_CARDS).map(lambda cards: Hand(cards[:13]))
+
+
+class HoldsCard:
+    """Condition on a single card, which does not reduce to points and shape."""
+
+    variable = None
+
+    def __init__(self, card: Card):
+        self.card = card
+
+    def evaluate(self, hand: Hand) -> bool:
+        return self.card in hand
+
+
+def test_there_are_560_shapes_of_13_cards():
+    shapes = list(all_shapes())
+    assert len(shapes) == len(set(shapes)) == 560
+    assert all(sum(shape) == 13 for shape in shapes)
+
+
+def test_built_table_has_entry_for_every_points_and_shape():
+    table = RuleTable(all_openings)
+    table.build()
+    assert len(table) == 560 * (MAX_POINTS + 1)
+
+
+@given(hand=hands)
+def test_table_matches_same_openings_as_interpreter(hand):
+    table = RuleTable(all_openings)
+    assert list(table.match(hand)) == [r for r in all_openings if r.match(hand)]
+
+
+@given(hand=hands)
+def test_table_falls_back_to_interpreter_for_other_conditions(hand):
+    spade_ace = HoldsCard(Card(Suit.SPADE, Rank.ACE))
+    rules = [
+        Rule(Bid(1, Trump.SPADE), exclude=[spade_ace]),
+        *all_openings,
+        Rule(Bid(1, Trump.CLUB), require=[spade_ace]),
+    ]
+    table = RuleTable(rules)
+    assert list(table.match(hand)) == [r for r in rules if r.match(hand)]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import random
+
+import hypothesis.strategies as st
+from bridge.bid import Bid, Trump
+from bridge.bidding import all_openings, open_2_clubs, open_3_spades
+from bridge.cards import ALL_CARDS, Hand, Suit
+from bridge.conditions import Condition, Variable, cards_min, points_range
+from bridge.dealer import deal_hands
+from bridge.optimizer import (
+    exact_samples,
+    hand_samples,
+    optimize_rule,
+    optimize_rules,
+    order_by_frequency,
+    order_conditions,
+)
+from bridge.rules import Rule
+from hypothesis import given, settings
+
+hands = st.permutations(ALL_CARDS).map(lambda cards: Hand(cards[:13]))
+
+samples = hand_samples(deal_hands(2000, rng=random.Random(5)))
+optimized_openings = optimize_rules(all_openings, samples)
+
+
+@settings(max_examples=300)
+@given(hand=hands)
+def test_optimized_openings_match_same_hands(hand):
+    assert [rule.match(hand) for rule in optimized_openings] == [
+        rule.match(hand) for rule in all_openings
+    ]
+
+
+def test_preempt_checks_card_count_before_points():
+    rule = optimize_rule(open_3_spades, exact_samples())
+    assert rule.require == [cards_min(7, Suit.SPADE), points_range(6, 10)]
+    assert rule.bid == open_3_spades.bid
+
+
+def test_excluded_conditions_which_hold_most_often_go_first():
+    conditions = [cards_min(6, Suit.CLUB), cards_min(4, Suit.CLUB)]
+    ordered = order_conditions(conditions, samples, rejecting=True)
+    assert ordered == conditions[::-1]
+
+
+def test_conditions_not_evaluable_on_profile_go_last():
+    unknown = Condition(Variable.CARDS)
+    conditions = [unknown, cards_min(4, Suit.CLUB), cards_min(6, Suit.CLUB)]
+    ordered = order_conditions(conditions, samples, rejecting=False)
+    assert ordered == [conditions[2], conditions[1], unknown]
+
+
+def test_conditions_keep_order_without_samples():
+    conditions = [points_range(6, 10), cards_min(7, Suit.SPADE)]
+    assert order_conditions(conditions, [], rejecting=False) == conditions
+
+
+def test_rules_are_ordered_from_most_often_matching():
+    never = Rule(Bid(7, Trump.NOTRUMP), require=[points_range(38, 40)])
+    always = Rule(Bid(1, Trump.CLUB))
+    ordered = order_by_frequency([never, open_2_clubs, always], samples)
+    assert ordered == [always, open_2_clubs, never]
+
+
+def test_rules_not_evaluable_on_profile_go_last():
+    unknown = Condition(Variable.CARDS)
+    excluding = Rule(Bid(1, Trump.HEART), exclude=[unknown])
+    requiring = Rule(Bid(1, Trump.SPADE), require=[unknown])
+    always = Rule(Bid(1, Trump.CLUB))
+    ordered = order_by_frequency(
+        [excluding, requiring, open_2_clubs, always], samples
+    )
+    assert ordered == [always, open_2_clubs, excluding, requiring]
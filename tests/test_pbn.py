@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+from bridge.cards import Hand
+from bridge.deal import Deal, Seat, Vulnerability
+from bridge.pbn import (
+    PbnRecord,
+    format_deal,
+    hand_from_pbn,
+    hand_to_pbn,
+    open_pbn,
+    parse_deal,
+    read_pbn,
+    write_pbn,
+)
+
+PBN_TEXT = """\
+% PBN 2.1
+% EXPORT
+{ Exported from a tournament
+  archive }
+[Event "Club \\"Pairs\\""]
+[Board "1"]
+[Dealer "N"]
+[Deal "N:KQ4.A9.T86.AKJ32 AJ3.KT85.Q.T9874 T9765.J64.AK97.Q 82.Q732.J5432.65"]
+[Auction "N"]
+1C Pass 1S Pass
+2C Pass Pass Pass
+
+[Board "2"]
+[Dealer "E"]
+[Deal "E:- - AKQJT98765432... -"]
+"""
+
+
+def test_pbn_hand_text_uses_t_for_tens():
+    hand = hand_from_pbn("KT4.A9.T86.AKJ32")
+    assert hand.as_text() == "K104.A9.1086.AKJ32"
+    assert hand_to_pbn(hand) == "KT4.A9.T86.AKJ32"
+
+
+def test_parsing_deal_gives_hands_by_seat_in_clockwise_order():
+    hands = parse_deal("E:- - AKQJT98765432... -")
+    assert list(hands) == ["N", "E", "S", "W"]
+    assert hands["W"].as_text() == "AKQJ1098765432..."
+    assert hands["N"] is None
+
+
+@pytest.mark.parametrize("value", ["", "N:...", "X:- - - -", "N - - - -"])
+def test_parsing_invalid_deal_throws(value):
+    with pytest.raises(ValueError, match=r"invalid deal"):
+        parse_deal(value)
+
+
+def test_formatting_deal_starts_from_first_seat():
+    hands = {"N": Hand.from_text("A..."), "S": Hand.from_text(".10..")}
+    assert format_deal(hands, first="S") == "S:.T.. - A... -"
+
+
+def test_reading_pbn_gives_tags_sections_and_hands():
+    first, second = read_pbn(io.StringIO(PBN_TEXT))
+    assert first.tags["Event"] == 'Club "Pairs"'
+    assert first.tags["Board"] == "1"
+    assert first.sections == {"Auction": ["1C Pass 1S Pass", "2C Pass Pass Pass"]}
+    hands = first.hands()
+    assert hands["E"].as_text() == "AJ3.K1085.Q.109874"
+    assert sum(len(hand) for hand in hands.values()) == 52
+    assert second.hands()["W"].points() == 10
+
+
+def test_reading_pbn_streams_records():
+    def lines():
+        yield from PBN_TEXT.splitlines()[:12]
+        raise AssertionError("read too far")
+
+    record = next(read_pbn(lines()))
+    assert record.tags["Board"] == "1"
+
+
+def test_reading_pbn_skips_end_of_line_comments():
+    text = '; exported by X\n[Board "1"]\n; about the auction\n[Auction "N"]\nPass\n'
+    (record,) = read_pbn(io.StringIO(text))
+    assert record.tags == {"Board": "1", "Auction": "N"}
+    assert record.sections == {"Auction": ["Pass"]}
+
+
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "latin-1"])
+def test_opening_pbn_detects_encoding(tmp_path, encoding):
+    path = tmp_path / "deals.pbn"
+    path.write_bytes(PBN_TEXT.replace("Club", "Café").encode(encoding))
+    with open_pbn(path) as file:
+        first, second = read_pbn(file)
+    assert first.tags["Event"] == 'Café "Pairs"'
+    assert second.tags["Board"] == "2"
+
+
+def test_reading_pbn_skips_byte_order_mark():
+    (record,) = read_pbn(io.StringIO('\ufeff[Board "1"]\n'))
+    assert record.tags == {"Board": "1"}
+
+
+def test_written_pbn_reads_back_the_same():
+    records = list(read_pbn(io.StringIO(PBN_TEXT)))
+    file = io.StringIO()
+    write_pbn(file, records)
+    file.seek(0)
+    assert list(read_pbn(file)) == records
+
+
+def test_writing_record_with_formatted_deal():
+    hands = {"N": Hand.from_text("AKQJ1098765432...")}
+    record = PbnRecord(tags={"Board": "7", "Deal": format_deal(hands)})
+    file = io.StringIO()
+    write_pbn(file, [record])
+    assert file.getvalue().endswith(
+        '[Board "7"]\n[Deal "N:AKQJT98765432... - - -"]\n'
+    )
+
+
+def test_record_gives_deal_with_dealer_and_vulnerability():
+    record = next(read_pbn(io.StringIO(PBN_TEXT.replace('"N"]', '"S"]', 1))))
+    record.tags["Vulnerable"] = "EW"
+    deal = record.deal()
+    assert deal.dealer == Seat.SOUTH
+    assert deal.vulnerability == Vulnerability.EAST_WEST
+    assert deal.hand(Seat.NORTH).as_text() == "KQ4.A9.1086.AKJ32"
+
+
+def test_record_of_deal_with_unknown_hands_throws():
+    second = list(read_pbn(io.StringIO(PBN_TEXT)))[1]
+    with pytest.raises(ValueError, match=r"unknown hands"):
+        second.deal()
+
+
+def test_record_from_deal_gives_same_deal():
+    record = next(read_pbn(io.StringIO(PBN_TEXT)))
+    deal = Deal(record.deal().hands, Seat.WEST, Vulnerability.BOTH)
+    new_record = PbnRecord.from_deal(deal, Board="5")
+    assert list(new_record.tags) == ["Board", "Dealer", "Vulnerable", "Deal"]
+    assert new_record.tags["Deal"].startswith("W:")
+    new_deal = new_record.deal()
+    assert (new_deal.dealer, new_deal.vulnerability) == (
+        deal.dealer,
+        deal.vulnerability,
+    )
+    assert [h.as_text() for h in new_deal.hands] == [h.as_text() for h in deal.hands]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from bridge.bid import Bid, Trump
+from bridge.cards import Hand, Suit
+from bridge.conditions import Condition, cards_min, points_min
+from bridge.profiling import profiling
+from bridge.rules import Rule
+
+
+def test_profiling_counts_calls_and_hits_of_rules_and_conditions():
+    strong = points_min(15)
+    hearts = cards_min(5, Suit.HEART)
+    clubs = cards_min(5, Suit.CLUB)
+    rule = Rule(Bid(1, Trump.HEART), require=[strong, hearts], exclude=[clubs])
+    weak_hand = Hand.from_text('987.AKQJ9.9654.87')
+    strong_hand = Hand.from_text('987.AKQJ9.654.AJ')
+    with profiling() as profiler:
+        assert rule.match(weak_hand) is False
+        assert rule.match(strong_hand) is True
+    assert profiler.rule_stats(rule).calls == 2
+    assert profiler.rule_stats(rule).hits == 1
+    assert profiler.condition_stats(rule, strong).calls == 2
+    assert profiler.condition_stats(rule, strong).hits == 1
+    assert profiler.condition_stats(rule, hearts).calls == 1
+    assert profiler.condition_stats(rule, clubs).calls == 1
+    assert profiler.condition_stats(rule, clubs).hit_rate == 0.0
+
+
+def test_profiling_records_time_within_rule_time():
+    rule = Rule(Bid(2, Trump.CLUB), require=[points_min(23)])
+    with profiling() as profiler:
+        for _ in range(100):
+            rule.match(Hand.from_text('AKQ.AKQ.AKQ.AKQ3'))
+    rule_time = profiler.rule_stats(rule).time
+    condition_time = profiler.condition_stats(rule, rule.require[0]).time
+    assert 0 < condition_time <= rule_time
+
+
+def test_profiling_restores_methods_after_block():
+    match = Rule.match
+    evaluate = Condition.evaluate
+    with profiling():
+        assert Rule.match is not match
+        assert Condition.evaluate is not evaluate
+    assert Rule.match is match
+    assert Condition.evaluate is evaluate
+
+
+def test_profiling_table_lists_rules_and_conditions():
+    rule = Rule(
+        Bid(2, Trump.CLUB), require=[points_min(23)], exclude=[points_min(30)]
+    )
+    with profiling() as profiler:
+        rule.match(Hand.from_text('AKQ.AKQ.AKQ.AKQ3'))
+        points_min(10).evaluate(Hand.from_text('AKQ.AKQ.AKQ.AKQ3'))
+    text = profiler.table().get_string()
+    assert "2C" in text
+    assert "od 23 PC" in text
+    assert "not od 30 PC" in text
+    assert "od 10 PC" in text
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from bridge.bid import Bid, Trump
+from bridge.deal import Deal, Seat, Vulnerability
+from bridge.scoring import (
+    ALL_BIDS,
+    Doubling,
+    Par,
+    deal_par,
+    par,
+    score,
+    scores,
+)
+
+
+@pytest.mark.parametrize(
+    ("bid", "tricks", "doubling", "vulnerable", "expected"),
+    [
+        (Bid(2, Trump.CLUB), 8, Doubling.UNDOUBLED, False, 90),
+        (Bid(1, Trump.NOTRUMP), 8, Doubling.UNDOUBLED, False, 120),
+        (Bid(3, Trump.NOTRUMP), 9, Doubling.UNDOUBLED, False, 400),
+        (Bid(3, Trump.NOTRUMP), 9, Doubling.UNDOUBLED, True, 600),
+        (Bid(4, Trump.SPADE), 10, Doubling.DOUBLED, True, 790),
+        (Bid(1, Trump.CLUB), 7, Doubling.REDOUBLED, False, 230),
+        (Bid(2, Trump.HEART), 10, Doubling.DOUBLED, False, 670),
+        (Bid(6, Trump.HEART), 13, Doubling.UNDOUBLED, True, 1460),
+        (Bid(7, Trump.NOTRUMP), 13, Doubling.REDOUBLED, True, 2980),
+        (Bid(4, Trump.SPADE), 7, Doubling.UNDOUBLED, True, -300),
+        (Bid(3, Trump.NOTRUMP), 5, Doubling.DOUBLED, False, -800),
+        (Bid(5, Trump.DIAMOND), 8, Doubling.DOUBLED, True, -800),
+        (Bid(4, Trump.HEART), 8, Doubling.REDOUBLED, True, -1000),
+    ],
+)
+def test_score_of_contract(bid, tricks, doubling, vulnerable, expected):
+    assert score(bid, tricks, doubling, vulnerable) == expected
+
+
+def test_scores_of_many_contracts_match_single_scores():
+    rng = np.random.default_rng(1)
+    bids = rng.integers(len(ALL_BIDS), size=100)
+    doublings = rng.integers(len(Doubling), size=100)
+    vulnerable = rng.integers(2, size=100).astype(bool)
+    tricks = rng.integers(14, size=100)
+    levels = np.array([ALL_BIDS[index].count for index in bids])
+    trumps = np.array([ALL_BIDS[index].trump.value for index in bids])
+    result = scores(levels, trumps, doublings, vulnerable, tricks)
+    for row, index in enumerate(bids):
+        assert result[row] == score(
+            ALL_BIDS[index],
+            tricks[row],
+            Doubling(doublings[row]),
+            vulnerable[row],
+        )
+
+
+def tricks_table(**strains):
+    table = {trump: (6, 6, 6, 6) for trump in Trump}
+    for text, tricks in strains.items():
+        table[Trump[text]] = tricks
+    return table
+
+
+def test_par_of_deal_with_no_makeable_contract_is_pass():
+    assert par(tricks_table()) == Par(0)
+    assert par(tricks_table()).as_text() == "Pass 0"
+
+
+def test_par_is_the_highest_scoring_contract():
+    table = tricks_table(SPADE=(10, 3, 10, 3), HEART=(5, 8, 5, 8))
+    assert par(table) == Par(420, Bid(4, Trump.SPADE), Seat.NORTH)
+
+
+def test_par_is_a_doubled_sacrifice_when_cheaper():
+    table = tricks_table(SPADE=(10, 3, 10, 3), HEART=(4, 9, 4, 9))
+    result = par(table, Seat.NORTH, Vulnerability.NORTH_SOUTH)
+    assert result == Par(300, Bid(5, Trump.HEART), Seat.EAST, Doubling.DOUBLED)
+    assert result.as_text() == "5HX-E +300"
+
+
+def test_par_gives_contract_makeable_by_both_sides_to_dealer_side():
+    table = tricks_table(CLUB=(8, 8, 8, 8))
+    assert par(table, Seat.EAST) == Par(-90, Bid(2, Trump.CLUB), Seat.EAST)
+    assert par(table, Seat.SOUTH) == Par(90, Bid(2, Trump.CLUB), Seat.SOUTH)
+
+
+def test_deal_par_uses_dealer_and_vulnerability_of_deal():
+    seats = [index % len(Seat) for index in range(52)]
+    deal = Deal.from_seats(seats, Seat.WEST, Vulnerability.EAST_WEST)
+    table = tricks_table(NOTRUMP=(3, 10, 3, 10))
+    assert deal_par(deal, table) == Par(-630, Bid(3, Trump.NOTRUMP), Seat.WEST)
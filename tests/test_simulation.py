@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+from bridge import simulation
+from bridge.simulation import pbn_stats, simulate
+from bridge.stats import BidStats
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(simulation, "CHUNK_HANDS", 100)
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_results_for_seed_do_not_depend_on_number_of_jobs(batch):
+    single = simulate(450, 12, seed=7, batch=batch)
+    parallel = simulate(450, 12, seed=7, jobs=2, batch=batch)
+    assert single.total == 450
+    assert parallel.counter_ == single.counter_
+
+
+def test_merged_shards_equal_a_single_run():
+    single = simulate(450, 12, seed=3)
+    merged = simulate(450, 12, seed=3, shard=(0, 2))
+    assert merged.total == 250
+    merged.merge(simulate(450, 12, seed=3, shard=(1, 2)))
+    assert merged.counter_ == single.counter_
+
+
+class Interrupted(Exception):
+    pass
+
+
+def test_resumed_run_equals_uninterrupted_run(monkeypatch, tmp_path):
+    checkpoint = tmp_path / "stats.json"
+    simulate_chunk = simulation.simulate_chunk
+    calls = []
+
+    def interrupted_chunk(*args):
+        calls.append(args)
+        if len(calls) > 2:
+            raise Interrupted
+        return simulate_chunk(*args)
+
+    monkeypatch.setattr(simulation, "simulate_chunk", interrupted_chunk)
+    with pytest.raises(Interrupted):
+        simulate(450, 12, seed=5, checkpoint=checkpoint, checkpoint_every=1)
+    monkeypatch.setattr(simulation, "simulate_chunk", simulate_chunk)
+    assert BidStats.load(checkpoint).total == 200
+
+    resumed = simulate(450, 12, seed=5, checkpoint=checkpoint)
+    assert resumed.counter_ == simulate(450, 12, seed=5).counter_
+    assert BidStats.load(checkpoint).counter_ == resumed.counter_
+
+
+def test_resuming_from_checkpoint_of_other_parameters_fails(tmp_path):
+    checkpoint = tmp_path / "stats.json"
+    simulate(150, 12, seed=1, checkpoint=checkpoint)
+    with pytest.raises(ValueError, match="other parameters"):
+        simulate(150, 12, seed=2, checkpoint=checkpoint)
+
+
+def test_resuming_from_checkpoint_inside_a_chunk_fails(tmp_path):
+    checkpoint = tmp_path / "stats.json"
+    stats = simulate(150, 12, seed=1)
+    stats.record([])
+    stats.save(checkpoint)
+    with pytest.raises(ValueError, match="does not end on a chunk"):
+        simulate(150, 12, seed=1, checkpoint=checkpoint)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_loose_tolerance_stops_after_first_chunk(jobs):
+    stats = simulate(450, 12, seed=9, jobs=jobs, tolerance=0.5)
+    assert stats.total == 100
+    assert stats.total < 450
+
+
+PBN_TEXT = """\
+[Board "1"]
+[Dealer "N"]
+[Deal "N:KQ4.A9.T86.AKJ32 AJ3.KT85.Q.T9874 T9765.J64.AK97.Q 82.Q732.J5432.65"]
+
+[Board "2"]
+[Dealer "E"]
+[Deal "E:- - AKQJT98765432... -"]
+"""
+
+
+def test_pbn_stats_of_seats_skip_deals_with_unknown_hands(tmp_path):
+    path = tmp_path / "deals.pbn"
+    path.write_text(PBN_TEXT, encoding="utf-8")
+    assert pbn_stats(path, 0, seats=True).total == 1
+    assert pbn_stats(path, 0).total == 5
+
+
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "latin-1"])
+def test_pbn_stats_read_files_in_either_encoding(tmp_path, encoding):
+    path = tmp_path / "deals.pbn"
+    text = PBN_TEXT.replace('[Board "1"]', '[Board "1"]\n[Site "Genève"]')
+    path.write_bytes(text.encode(encoding))
+    assert pbn_stats(path, 0).total == 5
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import random
+from functools import lru_cache
+
+import pytest
+from bridge.bid import Trump
+from bridge.cards import ALL_CARDS, Hand
+from bridge.deal import Seat
+from bridge.pbn import parse_deal
+from bridge.solver import DoubleDummy, solve, solve_all, solve_deals
+
+
+def hands_from_text(*texts):
+    return [Hand.from_text(text) for text in texts]
+
+
+def brute_force(hands, trump, leader):
+    """Return tricks of the leader's side, trying every card."""
+    trump_suit = trump.value if trump != Trump.NOTRUMP else -1
+
+    @lru_cache(maxsize=None)
+    def search(holdings, trick, player):
+        if len(trick) == len(Seat):
+            best = trick[0]
+            for play in trick[1:]:
+                if play[1] == best[1]:
+                    if play[2] > best[2]:
+                        best = play
+                elif play[1] == trump_suit:
+                    best = play
+            won = int(best[0] % 2 == leader % 2)
+            if not holdings[best[0]]:
+                return won
+            return won + search(holdings, (), best[0])
+        hand = holdings[player]
+        cards = [card for card in hand if trick and card[0] == trick[0][1]]
+        results = []
+        for card in cards or hand:
+            changed = list(holdings)
+            changed[player] = tuple(other for other in hand if other != card)
+            results.append(
+                search(tuple(changed), (*trick, (player, *card)), (player + 1) % 4)
+            )
+        return max(results) if player % 2 == leader % 2 else min(results)
+
+    holdings = tuple(
+        tuple(sorted((card.suit.value, card.rank.value) for card in hand))
+        for hand in hands
+    )
+    return search(holdings, (), leader)
+
+
+def test_top_cards_win_in_notrump():
+    hands = hands_from_text("AK...", "QJ...", "32...", "54...")
+    assert solve(hands, Trump.NOTRUMP) == (2, 0, 2, 0)
+
+
+def test_trumps_ruff_winners():
+    hands = hands_from_text("..AK.", "A...Q", "..32.", "..54.")
+    assert solve(hands, Trump.NOTRUMP) == (0, 0, 2, 0)
+    assert solve(hands, Trump.SPADE) == (0, 2, 0, 2)
+
+
+def test_finesse_fails_only_when_the_king_plays_last():
+    hands = hands_from_text("AQ...", "32...", "54...", "K6...")
+    assert solve(hands, Trump.NOTRUMP) == (2, 0, 2, 1)
+
+
+def test_full_deal_with_one_suit_in_every_hand():
+    hands = hands_from_text(
+        "AKQJ1098765432...",
+        ".AKQJ1098765432..",
+        "..AKQJ1098765432.",
+        "...AKQJ1098765432",
+    )
+    table = solve_all(hands)
+    assert table[Trump.NOTRUMP] == (0, 0, 0, 0)
+    assert table[Trump.SPADE] == (13, 0, 13, 0)
+    assert table[Trump.CLUB] == (0, 13, 0, 13)
+
+
+REFERENCE_DEAL = (
+    "N:QJ6.K652.J85.T98 873.J97.AT764.Q4 K5.T83.KQ9.A7652 AT942.AQ4.32.KJ3"
+)
+REFERENCE_TRICKS = {
+    Trump.CLUB: (7, 5, 7, 5),
+    Trump.DIAMOND: (5, 7, 5, 7),
+    Trump.HEART: (6, 6, 6, 6),
+    Trump.SPADE: (5, 8, 5, 8),
+    Trump.NOTRUMP: (6, 6, 6, 6),
+}
+
+
+def test_full_deal_has_known_tricks():
+    hands = list(parse_deal(REFERENCE_DEAL).values())
+    assert solve_all(hands) == REFERENCE_TRICKS
+    assert solve(hands, Trump.SPADE) == REFERENCE_TRICKS[Trump.SPADE]
+
+
+def test_search_of_full_deal_has_known_tricks():
+    hands = list(
+        parse_deal(
+            "N:AK654.973.64.KJ3 Q.T842.KQ952.872 JT873.J.T73.AT94 92.AKQ65.AJ8.Q65"
+        ).values()
+    )
+    assert DoubleDummy(hands).declarer_tricks(Trump.CLUB) == (9, 4, 9, 4)
+    assert solve(hands, Trump.CLUB) == (9, 4, 9, 4)
+
+
+def test_solve_deals_solves_full_deals_and_endings_in_order():
+    full = hands_from_text(
+        "AKQJ1098765432...",
+        ".AKQJ1098765432..",
+        "..AKQJ1098765432.",
+        "...AKQJ1098765432",
+    )
+    ending = hands_from_text("AK.2..", "QJ.3..", "32.4..", "54.5..")
+    deals = [full, ending] * 20
+    assert list(solve_deals(deals)) == [solve_all(hands) for hands in deals]
+
+
+@pytest.mark.parametrize("num_cards", [1, 2, 3])
+def test_solver_agrees_with_brute_force(num_cards):
+    rng = random.Random(num_cards)
+    for _ in range(10):
+        deck = list(ALL_CARDS)
+        rng.shuffle(deck)
+        hands = [
+            deck[seat * num_cards : (seat + 1) * num_cards] for seat in range(4)
+        ]
+        solver = DoubleDummy(hands)
+        for trump in Trump:
+            for declarer in Seat:
+                leader = declarer.next().value
+                tricks = brute_force(hands, trump, leader)
+                if leader % 2 != declarer.value % 2:
+                    tricks = num_cards - tricks
+                assert solver.tricks(trump, declarer) == tricks
+
+
+def test_solve_all_covers_every_strain_and_declarer():
+    hands = hands_from_text("AK.2..", "QJ.3..", "32.4..", "54.5..")
+    table = solve_all(hands)
+    assert list(table) == list(Trump)
+    for trump, tricks in table.items():
+        assert tricks == solve(hands, trump)
+        assert tricks[0] + tricks[1] == 3
+
+
+@pytest.mark.parametrize(
+    "texts",
+    [
+        ("A...", "K...", "Q..."),
+        ("A...", "K...", "Q...", "A..."),
+        ("AK...", "Q...", "J...", "10..."),
+    ],
+)
+def test_invalid_hands_are_rejected(texts):
+    with pytest.raises(ValueError):
+        DoubleDummy(hands_from_text(*texts))
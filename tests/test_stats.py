@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from bridge.bid import Bid, Trump
+from bridge.bidding import open_1_clubs_natural, open_1_notrump, open_2_clubs
+from bridge.cards import Hand
+from bridge.deal import Deal, Seat
+from bridge.rules import Rule
+from bridge.stats import BidStats
+
+
+def test_recording_counts_hands_by_set_of_bids():
+    stats = BidStats()
+    stats.record([open_2_clubs])
+    stats.record([open_1_notrump, open_1_clubs_natural], count=2)
+    stats.record([open_1_clubs_natural, open_1_notrump])
+    stats.record([])
+    assert stats.counter_ == {
+        frozenset(["2C"]): 1,
+        frozenset(["1C (natural)", "1NT"]): 3,
+        frozenset(): 1,
+    }
+    assert stats.total == 5
+
+
+def test_recording_match_matrix_counts_rows():
+    rules = [open_2_clubs, open_1_notrump]
+    stats = BidStats()
+    stats.record_matrix(
+        rules, np.array([[1, 0], [1, 1], [0, 0], [1, 0]], dtype=bool)
+    )
+    assert stats.counter_ == {
+        frozenset(["2C"]): 2,
+        frozenset(["2C", "1NT"]): 1,
+        frozenset(): 1,
+    }
+
+
+@pytest.mark.parametrize("num_rules", [64, 70])
+def test_recording_match_matrix_of_many_rules_keeps_combinations_apart(num_rules):
+    rules = [Rule(Bid(1, Trump.CLUB), note=f"rule {i}") for i in range(num_rules)]
+    last = num_rules - 1
+    matrix = np.zeros((4, num_rules), dtype=bool)
+    matrix[0, 0] = matrix[1, [0, last]] = matrix[2, [1, last]] = matrix[3, last] = (
+        True
+    )
+    stats = BidStats()
+    stats.record_matrix(rules, matrix)
+    assert len(stats.counter_) == 4
+    assert frozenset([rules[1].as_text(), rules[last].as_text()]) in stats.counter_
+
+    stats = BidStats()
+    stats.record_openings(rules, np.array([0, 0, 1, 4]), matrix)
+    assert len(stats.counter_) == 4
+    assert stats.seat_counts() == {"1st seat": 2, "2nd seat": 1, "passed out": 1}
+
+
+def test_merging_adds_counts():
+    first = BidStats()
+    first.record([open_2_clubs], count=3)
+    second = BidStats()
+    second.record([open_2_clubs])
+    second.record([open_1_notrump])
+    first.merge(second)
+    assert first.counter_ == {frozenset(["2C"]): 4, frozenset(["1NT"]): 1}
+
+
+def test_saved_stats_load_with_same_counts_and_info(tmp_path):
+    stats = BidStats()
+    stats.record([open_2_clubs], count=7)
+    stats.record([open_1_notrump, open_1_clubs_natural])
+    stats.record([])
+    stats.info = {"seed": 3}
+    path = tmp_path / "stats.json"
+    stats.save(path)
+    loaded = BidStats.load(path)
+    assert loaded.counter_ == stats.counter_
+    assert loaded.info == {"seed": 3}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_loading_other_file_throws(tmp_path):
+    path = tmp_path / "other.json"
+    path.write_text('{"counts": []}')
+    with pytest.raises(ValueError, match=r"not a saved BidStats file"):
+        BidStats.load(path)
+
+
+def test_confidence_interval_contains_observed_fraction():
+    stats = BidStats()
+    stats.record([open_2_clubs], count=30)
+    stats.record([], count=70)
+    low, high = stats.confidence_interval(frozenset(["2C"]))
+    assert low < 0.3 < high
+    assert math.isclose(low, 0.2189, abs_tol=1e-4)
+    assert math.isclose(high, 0.3958, abs_tol=1e-4)
+
+
+def test_confidence_interval_narrows_with_more_hands():
+    stats = BidStats()
+    stats.record([open_2_clubs], count=3)
+    stats.record([], count=7)
+    low, high = stats.confidence_interval(frozenset(["2C"]))
+    stats.record([open_2_clubs], count=2997)
+    stats.record([], count=6993)
+    more_low, more_high = stats.confidence_interval(frozenset(["2C"]))
+    assert more_high - more_low < (high - low) / 10
+
+
+def test_stats_converge_when_all_intervals_are_narrow():
+    stats = BidStats()
+    assert not stats.converged(0.1)
+    stats.record([open_2_clubs], count=50)
+    stats.record([], count=50)
+    assert not stats.converged(0.1)
+    stats.record([open_2_clubs], count=950)
+    stats.record([], count=950)
+    assert stats.converged(0.1)
+
+
+def test_recording_openings_labels_bids_with_seat():
+    rules = [open_2_clubs, open_1_notrump]
+    stats = BidStats()
+    stats.record_openings(
+        rules,
+        np.array([0, 2, 4, 2]),
+        np.array([[1, 0], [0, 1], [0, 0], [0, 1]], dtype=bool),
+    )
+    assert stats.counter_ == {
+        frozenset(["1st seat: 2C"]): 1,
+        frozenset(["3rd seat: 1NT"]): 2,
+        frozenset(["passed out"]): 1,
+    }
+    assert stats.seat_counts() == {"1st seat": 1, "3rd seat": 2, "passed out": 1}
+
+
+def test_recording_deal_walks_seats_from_dealer():
+    texts = ("AKQJ.AKQJ.AKQ.AK", "32.32.32.5432", "2.2.2.2", "2.2.2.2")
+    deal = Deal(tuple(Hand.from_text(t) for t in texts), dealer=Seat.WEST)
+    stats = BidStats()
+    stats.record_deal(deal, lambda hand: [open_2_clubs] if len(hand) > 4 else [])
+    stats.record_deal(deal, lambda hand: [])
+    assert stats.counter_ == {
+        frozenset(["2nd seat: 2C"]): 1,
+        frozenset(["passed out"]): 1,
+    }
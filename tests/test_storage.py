@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from bridge.batch import deal
+from bridge.storage import (
+    DEAL_SIZE,
+    HEADER,
+    DealFile,
+    DealWriter,
+    pack,
+    unpack,
+    write_deals,
+)
+
+
+def test_packing_deal_takes_13_bytes_and_unpacks_to_same_deal():
+    deals = deal(50, np.random.default_rng(1))
+    packed = pack(deals)
+    assert packed.shape == (50, 13)
+    assert packed.dtype == np.uint8
+    assert (unpack(packed) == deals).all()
+
+
+def test_packing_puts_first_card_in_lowest_bits():
+    deals = np.zeros((1, 52), dtype=np.uint8)
+    deals[0, :4] = [1, 2, 3, 0]
+    assert pack(deals)[0, 0] == 0b00_11_10_01
+
+
+def test_deal_file_gives_random_access_to_written_deals(tmp_path):
+    path = tmp_path / "deals.bin"
+    deals = deal(30, np.random.default_rng(2))
+    with DealWriter(path) as writer:
+        writer.write(deals[:10])
+        writer.write(deals[10:])
+    assert path.stat().st_size == len(HEADER) + 30 * DEAL_SIZE
+
+    deal_file = DealFile(path)
+    assert len(deal_file) == 30
+    assert (deal_file[7] == deals[7]).all()
+    assert (deal_file[5:9] == deals[5:9]).all()
+    assert (deal_file[[1, 20]] == deals[[1, 20]]).all()
+    assert deal_file.raw.base is not None
+
+
+def test_deal_file_batches_cover_all_deals_in_order(tmp_path):
+    path = tmp_path / "deals.bin"
+    write_deals(path, 25, np.random.default_rng(3), batch_size=10)
+    batches = list(DealFile(path).batches(batch_size=7))
+    assert [len(batch) for batch in batches] == [7, 7, 7, 4]
+    deals = np.concatenate(batches)
+    for seat in range(4):
+        assert ((deals == seat).sum(axis=1) == 13).all()
+
+
+def test_written_deals_are_same_for_same_seed(tmp_path):
+    write_deals(tmp_path / "a.bin", 20, np.random.default_rng(4), batch_size=8)
+    write_deals(tmp_path / "b.bin", 20, np.random.default_rng(4), batch_size=8)
+    assert (tmp_path / "a.bin").read_bytes() == (tmp_path / "b.bin").read_bytes()
+
+
+def test_empty_deal_file_has_no_deals(tmp_path):
+    path = tmp_path / "deals.bin"
+    DealWriter(path).close()
+    assert len(DealFile(path)) == 0
+    assert list(DealFile(path).batches()) == []
+
+
+@pytest.mark.parametrize("content", [b"", b"other file", HEADER + b"\x00" * 12])
+def test_opening_other_file_throws(tmp_path, content):
+    path = tmp_path / "other.bin"
+    path.write_bytes(content)
+    with pytest.raises(ValueError, match=r"is not a deal file"):
+        DealFile(path)